@@ -1,5 +1,6 @@
 """Пакет CRUD-операций."""
 
+from app.crud.base import get_version # noqa
 from app.crud.categories import crud as category_crud # noqa
 from app.crud.products import crud as product_crud # noqa
 from app.crud.stores import crud as store_crud # noqa
@@ -14,6 +14,22 @@ from app.validate.validators import ensure_item_exists, normalize_name
 ModelT = TypeVar('ModelT')
 logger = logging.getLogger(__name__)
 
+# Счётчики изменений по таблицам: растут на каждом create/update/delete.
+# GUI сравнивает их с запомненными, чтобы не перечитывать справочники зря.
+_version: dict[str, int] = {}
+
+
+def get_version(table: str) -> int:
+    """Вернуть текущую версию данных таблицы.
+
+    Args:
+        table: Имя таблицы (`__tablename__` модели).
+
+    Returns:
+        int: Монотонный счётчик изменений (0, если изменений не было).
+    """
+    return _version.get(table, 0)
+
 
 class CRUDBase(Generic[ModelT]):
     def __init__(
@@ -27,6 +43,25 @@ class CRUDBase(Generic[ModelT]):
         """
         self.model = model
 
+    def _bump_version(self) -> None:
+        """Увеличить счётчик изменений таблицы модели."""
+        table = self.model.__tablename__
+        _version[table] = _version.get(table, 0) + 1
+
+    def exists(self, db: Session) -> bool:
+        """Проверить, есть ли в таблице хотя бы одна запись.
+
+        Выполняет `SELECT 1 ... LIMIT 1` без загрузки объектов.
+
+        Args:
+            db: Активная SQLAlchemy-сессия.
+
+        Returns:
+            bool: True, если таблица не пуста.
+        """
+        stmt = select(1).select_from(self.model).limit(1)
+        return db.scalar(stmt) is not None
+
     def exists_by_name_ci(
         self,
         db,
@@ -96,6 +131,32 @@ class CRUDBase(Generic[ModelT]):
         ensure_item_exists(obj, self.model.__name__, obj_id)
         return obj
 
+    def get_with_relations_or_raise(
+        self,
+        db: Session,
+        obj_id: int,
+    ) -> ModelT:
+        """Получает объект по ID вместе со связями из `_with_relations`.
+
+        Объект можно читать и после закрытия сессии.
+
+        Args:
+            db: Сессия SQLAlchemy.
+            obj_id: Идентификатор объекта.
+
+        Returns:
+            ModelT: Найденный объект.
+
+        Raises:
+            ValueError: Если объект не найден.
+        """
+        stmt = self._with_relations(
+            select(self.model).where(self.model.id == obj_id)
+        )
+        obj = db.scalars(stmt).first()
+        ensure_item_exists(obj, self.model.__name__, obj_id)
+        return obj
+
     def list(
         self,
         db: Session,
@@ -106,6 +167,9 @@ class CRUDBase(Generic[ModelT]):
     ) -> list[ModelT]:
         """Возвращает список объектов с пагинацией и сортировкой.
 
+        Связи из `_with_relations` подгружаются тем же запросом пачкой,
+        без ленивой загрузки на каждый объект.
+
         Args:
             db: Сессия SQLAlchemy.
             offset: Смещение выборки.
@@ -120,6 +184,40 @@ class CRUDBase(Generic[ModelT]):
         ).offset(offset).limit(limit)
         if order_by is not None:
             stmt = stmt.order_by(order_by)
+        stmt = self._with_relations(stmt)
+        return list(db.scalars(stmt).all())
+
+    def _with_relations(self, stmt):
+        """Добавить к запросу загрузку связей (переопределяется)."""
+        return stmt
+
+    def fetch_page(
+        self,
+        db: Session,
+        *,
+        after_id: Optional[int] = None,
+        limit: int = 100,
+    ) -> list[ModelT]:
+        """Возвращает страницу объектов по курсору (keyset-пагинация).
+
+        В отличие от `list` с offset, БД не пропускает уже прочитанные
+        строки: выборка идёт по индексу первичного ключа сразу от курсора.
+
+        Args:
+            db: Сессия SQLAlchemy.
+            after_id: ID последнего объекта предыдущей страницы
+                (None — с начала).
+            limit: Максимальное число объектов.
+
+        Returns:
+            list[ModelT]: Объекты с id > after_id по возрастанию id.
+        """
+        stmt = select(self.model)
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+        stmt = self._with_relations(
+            stmt.order_by(self.model.id).limit(limit)
+        )
         return list(db.scalars(stmt).all())
 
     def create(
@@ -143,6 +241,7 @@ class CRUDBase(Generic[ModelT]):
         if commit:
             db.commit()
             db.refresh(obj_in)
+        self._bump_version()
         return obj_in
 
     def update(
@@ -177,6 +276,7 @@ class CRUDBase(Generic[ModelT]):
         if commit:
             db.commit()
             db.refresh(obj)
+        self._bump_version()
         return obj
 
     def delete(
@@ -197,3 +297,4 @@ class CRUDBase(Generic[ModelT]):
         db.delete(obj)
         if commit:
             db.commit()
+        self._bump_version()
@@ -1,45 +1,46 @@
 """CRUD-операции для продуктов."""
 
+from typing import Optional
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 
 from app.crud.base import CRUDBase
-from app.models import Product
-from app.validate.validators import ensure_item_exists
+from app.models import Product, Unit
 
 
 class ProductCRUD(CRUDBase[Product]):
+    def list_with_units(
+        self,
+        db: Session,
+        *,
+        limit: int = 100,
+    ) -> list[tuple[int, str, Optional[str], Optional[str]]]:
+        """Возвращает продукты с единицей измерения одним запросом.
+
+        Читаются только нужные колонки через JOIN с единицами, без
+        объектов Product/Unit и без отдельного запроса на каждую связь.
+
+        Args:
+            db: Сессия SQLAlchemy.
+            limit: Максимальное число продуктов.
+
+        Returns:
+            list[tuple]: (id, name, measure_type, unit) по возрастанию id.
+        """
+        stmt = (
+            select(Product.id, Product.name, Unit.measure_type, Unit.unit)
+            .outerjoin(Unit, Product.unit_id == Unit.id)
+            .order_by(Product.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in db.execute(stmt)]
+
     def _with_relations(self, stmt):
         return stmt.options(
             selectinload(Product.category),
             selectinload(Product.unit),
         )
 
-    def get_with_relations_or_raise(
-        self,
-        db: Session,
-        obj_id: int
-    ) -> Product:
-        stmt = self._with_relations(
-            select(Product).where(Product.id == obj_id)
-        )
-        obj = db.scalars(stmt).first()
-        ensure_item_exists(obj, self.model.__name__, obj_id)
-        return obj
-
-    def list(
-        self,
-        db: Session,
-        *,
-        offset=0,
-        limit=100,
-        order_by=None
-    ) -> list[Product]:
-        stmt = select(Product)
-        if order_by is not None:
-            stmt = stmt.order_by(order_by)
-        stmt = self._with_relations(stmt.offset(offset).limit(limit))
-        return list(db.scalars(stmt).all())
-
 
 crud = ProductCRUD(Product)
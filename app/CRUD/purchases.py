@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Optional
+from typing import Any, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
 from sqlalchemy.orm import Session, selectinload
 
 from app.crud.base import CRUDBase
@@ -109,9 +109,9 @@ class PurchaseCRUD(CRUDBase[Purchase]):
         stmt = self._with_relations(stmt.order_by(Purchase.purchase_date))
         return list(db.scalars(stmt).all())
 
-    def list_filtered(
+    def _filtered(
         self,
-        db: Session,
+        stmt,
         *,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
@@ -120,26 +120,8 @@ class PurchaseCRUD(CRUDBase[Purchase]):
         product_ids: Optional[list[int]] = None,
         category_id: Optional[int] = None,
         is_promo: Optional[bool] = None,
-        order_by=None,
-    ) -> list[Purchase]:
-        """Универсальная выборка покупок для аналитики.
-
-        Args:
-            db: Сессия SQLAlchemy.
-            date_from: Начальная дата.
-            date_to: Конечная дата.
-            store_id: Идентификатор магазина.
-            product_id: Идентификатор продукта.
-            product_ids: Список идентификаторов продуктов.
-            category_id: Идентификатор категории.
-            is_promo: Фильтр по акциям.
-            order_by: Поле сортировки.
-
-        Returns:
-            list[Purchase]: Список покупок.
-        """
-        stmt = select(Purchase)
-
+    ):
+        """Добавить к запросу условия фильтров `list_filtered`."""
         if category_id is not None:
             stmt = stmt.join(
                 Purchase.product
@@ -163,10 +145,121 @@ class PurchaseCRUD(CRUDBase[Purchase]):
             stmt = stmt.where(Purchase.purchase_date >= date_from)
         if date_to is not None:
             stmt = stmt.where(Purchase.purchase_date <= date_to)
+        return stmt
+
+    def list_filtered(
+        self,
+        db: Session,
+        *,
+        order_by=None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> list[Purchase]:
+        """Универсальная выборка покупок для аналитики и UI.
+
+        Покупки с одной датой упорядочены по id, так что страницы
+        (offset/limit) не пересекаются и не теряют строк.
+
+        Args:
+            db: Сессия SQLAlchemy.
+            order_by: Поле сортировки.
+            offset: Сколько покупок пропустить.
+            limit: Максимальное число покупок (None — без ограничения).
+            **filters: date_from, date_to, store_id, product_id,
+                product_ids, category_id, is_promo — см. `_filtered`.
 
-        stmt = stmt.order_by(order_by or Purchase.purchase_date)
+        Returns:
+            list[Purchase]: Список покупок.
+        """
+        stmt = self._filtered(select(Purchase), **filters)
+        stmt = stmt.order_by(
+            order_by if order_by is not None else Purchase.purchase_date,
+            Purchase.id,
+        )
+        if offset:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
         stmt = self._with_relations(stmt)
         return list(db.scalars(stmt).all())
 
+    def rows_filtered(
+        self,
+        db: Session,
+        columns: Sequence[Any],
+        *,
+        category_id: Optional[int] = None,
+        **filters: Any,
+    ) -> list[Row]:
+        """Выбранные колонки покупок под фильтрами `list_filtered`.
+
+        Объекты Purchase не создаются: БД отдаёт только запрошенные
+        колонки. Продукт, категория и магазин уже присоединены, так что
+        их колонки выбираются наравне с колонками покупки.
+
+        Args:
+            db: Сессия SQLAlchemy.
+            columns: Колонки (выражения) для SELECT.
+            category_id: ID категории.
+            **filters: Остальные фильтры `_filtered`.
+
+        Returns:
+            list[Row]: Строки в порядке даты покупки и id.
+        """
+        stmt = (
+            select(*columns)
+            .select_from(Purchase)
+            .join(Purchase.product)
+            .outerjoin(Product.category)
+            .join(Purchase.store)
+        )
+        if category_id is not None:
+            stmt = stmt.where(Product.category_id == category_id)
+        stmt = self._filtered(stmt, **filters).order_by(
+            Purchase.purchase_date, Purchase.id
+        )
+        return list(db.execute(stmt).all())
+
+    def date_bounds_filtered(
+        self,
+        db: Session,
+        **filters: Any,
+    ) -> tuple[Optional[date], Optional[date]]:
+        """Первая и последняя даты покупок под фильтрами `list_filtered`.
+
+        Args:
+            db: Сессия SQLAlchemy.
+            **filters: Те же фильтры, что у `list_filtered`.
+
+        Returns:
+            tuple[Optional[date], Optional[date]]: (MIN, MAX) даты покупки;
+            (None, None), если покупок нет.
+        """
+        stmt = self._filtered(
+            select(
+                func.min(Purchase.purchase_date),
+                func.max(Purchase.purchase_date),
+            ),
+            **filters,
+        )
+        first, last = db.execute(stmt).one()
+        return first, last
+
+    def count_filtered(self, db: Session, **filters: Any) -> int:
+        """Считает покупки под фильтрами `list_filtered` (COUNT в БД).
+
+        Args:
+            db: Сессия SQLAlchemy.
+            **filters: Те же фильтры, что у `list_filtered`.
+
+        Returns:
+            int: Число покупок.
+        """
+        stmt = self._filtered(
+            select(func.count(Purchase.id)), **filters
+        )
+        return int(db.scalar(stmt) or 0)
+
 
 crud = PurchaseCRUD(Purchase)
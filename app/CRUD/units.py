@@ -1,11 +1,32 @@
 """CRUD-операции для единиц измерения."""
 
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
 from app.crud.base import CRUDBase
 from app.models import Unit
 
 
 class UnitCRUD(CRUDBase[Unit]):
-    pass
+    def distinct_measure_types(self, db: Session) -> list[str]:
+        """Возвращает различные типы единиц измерения по алфавиту.
+
+        DISTINCT и сортировка выполняются в БД: читаются только строки,
+        без загрузки объектов Unit.
+
+        Args:
+            db: Сессия SQLAlchemy.
+
+        Returns:
+            list[str]: Непустые значения measure_type без повторов.
+        """
+        stmt = (
+            select(Unit.measure_type)
+            .where(Unit.measure_type.is_not(None))
+            .distinct()
+            .order_by(Unit.measure_type)
+        )
+        return [mt for mt in db.scalars(stmt) if mt]
 
 
 crud = UnitCRUD(Unit)
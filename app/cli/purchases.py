@@ -19,8 +19,8 @@ from app.service.purchases import (
     delete_purchase,
     get_purchase_by_id,
     get_purchase_by_product,
-    get_purchase_by_store,
     list_purchases,
+    list_purchases_filtered,
     update_purchase,
 )
 
@@ -118,8 +118,7 @@ def _list(args: argparse.Namespace) -> list[Purchase]:
 
     Приоритет фильтров:
     1) если задан `--product-id`, возвращает покупки продукта в диапазоне дат;
-    2) если задан `--store-id`, возвращает покупки магазина и дополнительно
-       фильтрует по датам;
+    2) если задан `--store-id`, возвращает покупки магазина в диапазоне дат;
     3) иначе — общий список с пагинацией и сортировкой (`list_purchases`).
 
     Args:
@@ -150,19 +149,13 @@ def _list(args: argparse.Namespace) -> list[Purchase]:
         )
 
     if args.store_id is not None:
-        items = get_purchase_by_store(
+        # Магазин, даты и промо — одним запросом, без фильтрации в Python.
+        return list_purchases_filtered(
             store_id=args.store_id,
-            is_promo=promo_filter
+            from_date=args.from_date,
+            to_date=args.to_date,
+            is_promo=promo_filter,
         )
-        if args.from_date is not None:
-            items = [
-                item for item in items if item.purchase_date >= args.from_date
-            ]
-        if args.to_date is not None:
-            items = [
-                item for item in items if item.purchase_date <= args.to_date
-            ]
-        return items
 
     order_col = ORDER_MAP[args.order]
     return list_purchases(
@@ -34,6 +34,27 @@ class PreBase:
     )
     to_update = Column(DateTime, nullable=True)
 
+    def _values(self, names: tuple[str, ...]) -> list:
+        """Значения атрибутов объекта в порядке `names`.
+
+        Загруженные колонки и связи SQLAlchemy держит в `__dict__`
+        экземпляра — они читаются оттуда, без дескриптора на каждое
+        поле. Если какого-то атрибута там нет (не загружен, просрочен,
+        не задан), все значения берутся обычным getattr со всей его
+        логикой догрузки и значений по умолчанию.
+
+        Args:
+            names: Имена атрибутов.
+
+        Returns:
+            list: Значения в том же порядке.
+        """
+        state = self.__dict__
+        try:
+            return [state[name] for name in names]
+        except KeyError:
+            return [getattr(self, name) for name in names]
+
 
 Base = declarative_base(cls=PreBase)
 
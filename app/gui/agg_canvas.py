@@ -0,0 +1,81 @@
+"""Лёгкий холст matplotlib для GUI."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QSizePolicy, QWidget
+
+
+class AggCanvas(QWidget):
+    """Виджет, показывающий фигуру matplotlib, отрендеренную в Agg.
+
+    В отличие от FigureCanvasQTAgg, фигура рисуется в offscreen-буфер
+    только после `draw_idle()` или изменения размера, а `paintEvent`
+    лишь копирует готовую картинку на экран. Повторные перерисовки
+    окна (перекрытие, переключение вкладок) не трогают matplotlib.
+    """
+
+    def __init__(self, figure: Figure, parent=None):
+        super().__init__(parent)
+        self.figure = figure
+        self._canvas_agg = FigureCanvasAgg(figure)
+        self._base_dpi = figure.dpi
+
+        self._buf: Optional[np.ndarray] = None
+        self._image: Optional[QImage] = None
+        self._dirty = True
+
+        self.setSizePolicy(
+            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
+        )
+
+    def draw_idle(self) -> None:
+        """Помечает фигуру как изменённую и планирует перерисовку."""
+        self._dirty = True
+        self.update()
+
+    def resizeEvent(self, event) -> None:  # noqa: ANN001
+        dpr = self.devicePixelRatioF()
+        self.figure.set_dpi(self._base_dpi * dpr)
+        self.figure.set_size_inches(
+            max(self.width(), 1) / self._base_dpi,
+            max(self.height(), 1) / self._base_dpi,
+            forward=False,
+        )
+        self._dirty = True
+        super().resizeEvent(event)
+
+    def _render(self) -> None:
+        """Рендерит фигуру в Agg и оборачивает RGBA-буфер в QImage."""
+        self._canvas_agg.draw()
+        buf = np.asarray(self._canvas_agg.buffer_rgba())
+        height, width = buf.shape[:2]
+
+        image = QImage(
+            buf.data,
+            width,
+            height,
+            buf.strides[0],
+            QImage.Format.Format_RGBA8888,
+        )
+        image.setDevicePixelRatio(self.devicePixelRatioF())
+
+        # QImage не копирует данные: буфер должен жить, пока жива картинка.
+        self._buf = buf
+        self._image = image
+        self._dirty = False
+
+    def paintEvent(self, event) -> None:  # noqa: ANN001
+        if self._dirty:
+            self._render()
+        if self._image is None:
+            return
+
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self._image)
+        painter.end()
@@ -5,7 +5,6 @@ from typing import Optional
 
 import matplotlib.dates as mdates
 import pandas as pd
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt6.QtCore import QDate
 from PyQt6.QtWidgets import (
@@ -23,9 +22,10 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from app.crud import category_crud, product_crud, store_crud
+from app.crud import category_crud, get_version, product_crud, store_crud
+from app.gui.agg_canvas import AggCanvas
 from app.gui.data_manager import DataManagerDialog
-from app.gui.qt_helpers import setup_searchable_combo
+from app.gui.qt_helpers import fill_combo, setup_searchable_combo
 from app.service import analytics as svc
 from app.service.crud_service import list_items
 from app.service.purchases import (
@@ -40,6 +40,18 @@ _GROUP_FREQ = {
     'Год': 'year',
 }
 
+# От каких таблиц зависит содержимое каждого списка на панели параметров.
+_RELOAD_DEPS = {
+    'products': ('product', 'unit', 'purchase'),
+    'categories': ('category', 'purchase'),
+    'stores': ('store', 'purchase'),
+    'date_bounds': ('purchase',),
+}
+
+# Шаблоны подписей в списках: метод format связывается один раз.
+_PRODUCT_LABEL = '{name} ({unit}) — {n}'.format
+_COUNTED_LABEL = '{name} — {n}'.format
+
 
 class AnalyticsWidget(QWidget):
     def __init__(self, parent=None):
@@ -47,6 +59,7 @@ class AnalyticsWidget(QWidget):
 
         self._data_min: Optional[date] = None
         self._data_max: Optional[date] = None
+        self._loaded_versions: dict[str, tuple[int, ...]] = {}
 
         # --- Верхняя панель (кнопки) ---
         self.btn_data = QPushButton('Данные…')
@@ -129,7 +142,7 @@ class AnalyticsWidget(QWidget):
 
         # --- Правая панель (график + метрики) ---
         self.figure = Figure(figsize=(6, 4))
-        self.canvas = FigureCanvas(self.figure)
+        self.canvas = AggCanvas(self.figure)
         self.ax = self.figure.add_subplot(111)
 
         self.kpi = QLabel('Выбери параметры и нажми «Построить».')
@@ -187,6 +200,7 @@ class AnalyticsWidget(QWidget):
         - minimum/maximum для QDateEdit
         - текущие значения полей даты.
         """
+        self._remember_versions('date_bounds')
         dmin, dmax = get_purchase_date_bounds()
         self._data_min = dmin
         self._data_max = dmax
@@ -218,59 +232,95 @@ class AnalyticsWidget(QWidget):
 
     # ------------------- reload combos with counts -------------------
 
+    @staticmethod
+    def _current_versions(key: str) -> tuple[int, ...]:
+        return tuple(get_version(t) for t in _RELOAD_DEPS[key])
+
+    def _remember_versions(self, key: str) -> None:
+        """Запоминает версии таблиц, на которых построен список."""
+        self._loaded_versions[key] = self._current_versions(key)
+
+    def _is_stale(self, key: str) -> bool:
+        """Проверяет, менялись ли данные списка с момента загрузки."""
+        return self._loaded_versions.get(key) != self._current_versions(key)
+
     def reload_products(self) -> None:
         """Перезагружает список продуктов и добавляет счётчик покупок."""
-        self.product_combo.clear()
-        self.product_combo.addItem('— выбери продукт —', None)
+        self._remember_versions('products')
 
         counts = get_purchase_usage_counts()
         prod_cnt = counts.get('products', {})
 
         products = list_items(product_crud, limit=5000)
-        for p in products:
-            unit = ''
-            if getattr(p, 'unit', None):
-                unit = f'{p.unit.measure_type} {p.unit.unit}'
-            cnt = int(prod_cnt.get(p.id, 0))
-            self.product_combo.addItem(
-                f'{p.name} ({unit}) — {cnt}',
-                p.id
+        labels = [
+            _PRODUCT_LABEL(
+                name=p.name,
+                unit=f'{u.measure_type} {u.unit}' if (u := p.unit) else '',
+                n=int(prod_cnt.get(p.id, 0)),
             )
+            for p in products
+        ]
+        fill_combo(
+            self.product_combo,
+            '— выбери продукт —',
+            labels,
+            [p.id for p in products],
+        )
 
     def reload_categories(self) -> None:
         """Перезагружает список категорий и добавляет счётчик покупок."""
-        self.category_combo.clear()
-        self.category_combo.addItem('— выбери категорию —', None)
+        self._remember_versions('categories')
 
         counts = get_purchase_usage_counts()
         cat_cnt = counts.get('categories', {})
 
         cats = list_items(category_crud, limit=5000)
-        for c in cats:
-            cnt = int(cat_cnt.get(c.id, 0))
-            self.category_combo.addItem(f'{c.name} — {cnt}', c.id)
+        labels = [
+            _COUNTED_LABEL(name=c.name, n=int(cat_cnt.get(c.id, 0)))
+            for c in cats
+        ]
+        fill_combo(
+            self.category_combo,
+            '— выбери категорию —',
+            labels,
+            [c.id for c in cats],
+        )
 
     def reload_stores(self) -> None:
         """Перезагружает список магазинов и добавляет счётчик покупок."""
-        self.store_combo.clear()
-        self.store_combo.addItem('— выбери магазин —', None)
+        self._remember_versions('stores')
 
         counts = get_purchase_usage_counts()
         store_cnt = counts.get('stores', {})
 
         stores = list_items(store_crud, limit=5000)
-        for s in stores:
-            cnt = int(store_cnt.get(s.id, 0))
-            self.store_combo.addItem(f'{s.name} — {cnt}', s.id)
+        labels = [
+            _COUNTED_LABEL(name=s.name, n=int(store_cnt.get(s.id, 0)))
+            for s in stores
+        ]
+        fill_combo(
+            self.store_combo,
+            '— выбери магазин —',
+            labels,
+            [s.id for s in stores],
+        )
 
     def open_data_manager(self) -> None:
-        """Открывает диалог управления данными и обновляет списки."""
+        """Открывает диалог управления данными и обновляет списки.
+
+        Перезагружаются только те списки, чьи таблицы действительно
+        менялись, пока диалог был открыт.
+        """
         dlg = DataManagerDialog(self)
         dlg.exec()
-        self.reload_products()
-        self.reload_categories()
-        self.reload_stores()
-        self._init_date_bounds()
+        if self._is_stale('products'):
+            self.reload_products()
+        if self._is_stale('categories'):
+            self.reload_categories()
+        if self._is_stale('stores'):
+            self.reload_stores()
+        if self._is_stale('date_bounds'):
+            self._init_date_bounds()
 
     # ------------------- kind switching -------------------
 
@@ -537,9 +587,12 @@ class AnalyticsWidget(QWidget):
 
         y = pd.to_numeric(y, errors='coerce')
 
-        mask = x.notna() & y.notna()
-        x = x[mask]
-        y = y[mask]
+        # Сервис помечает флагом 'sorted' точки, уже упорядоченные по
+        # периоду и без пропусков — тогда чистка и сортировка не нужны.
+        if not res.get('sorted'):
+            mask = x.notna() & y.notna()
+            x = x[mask].sort_values()
+            y = y[mask].loc[x.index]
         if len(x) == 0:
             self.canvas.draw_idle()
             self.kpi.setText('Нет данных под выбранные фильтры.')
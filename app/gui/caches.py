@@ -0,0 +1,103 @@
+"""Кеши справочников для GUI."""
+
+from __future__ import annotations
+
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+from app.crud import (
+    category_crud,
+    get_version,
+    store_crud,
+    unit_crud,
+)
+from app.service.crud_service import list_items
+from app.service.product import list_products_with_unit
+from app.service.unit import list_measure_types
+
+T = TypeVar('T')
+
+# Сколько максимум читать из справочника для выпадающих списков.
+_REFS_LIMIT = 5000
+
+
+def ttl_cache(
+    ttl: float,
+    *tables: str,
+) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """Кеширует результат функции без аргументов.
+
+    Значение считается заново, если прошло больше `ttl` секунд или
+    изменилась версия одной из `tables` (см. `app.crud.get_version`),
+    то есть после create/update/delete в этом процессе. TTL нужен для
+    изменений, сделанных в обход приложения (CLI, другой процесс).
+
+    Args:
+        ttl: Время жизни значения в секундах.
+        *tables: Таблицы, от которых зависит значение.
+    """
+    def decorator(fn: Callable[[], T]) -> Callable[[], T]:
+        state: Dict[str, Any] = {}
+
+        @wraps(fn)
+        def wrapper() -> T:
+            versions = tuple(get_version(t) for t in tables)
+            now = time.monotonic()
+            if (
+                state
+                and state['versions'] == versions
+                and now - state['at'] < ttl
+            ):
+                return state['value']
+            value = fn()
+            state.update(value=value, versions=versions, at=now)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@ttl_cache(60, 'category')
+def get_categories_cached() -> List[Tuple[int, str]]:
+    """Категории как (id, name)."""
+    return [
+        (int(c.id), c.name)
+        for c in list_items(category_crud, limit=_REFS_LIMIT)
+    ]
+
+
+@ttl_cache(60, 'unit')
+def get_units_cached() -> List[Tuple[int, str]]:
+    """Единицы измерения как (id, подпись 'measure_type (unit)')."""
+    return [
+        (int(u.id), f'{u.measure_type} ({u.unit})')
+        for u in list_items(unit_crud, limit=_REFS_LIMIT)
+    ]
+
+
+@ttl_cache(60, 'product', 'unit')
+def get_products_cached() -> List[Tuple[int, str, str, str]]:
+    """Продукты как (id, name, measure_type, unit)."""
+    return [
+        (int(p_id), name, measure_type or '', unit or '')
+        for p_id, name, measure_type, unit in list_products_with_unit(
+            limit=_REFS_LIMIT
+        )
+    ]
+
+
+@ttl_cache(60, 'store')
+def get_stores_cached() -> List[Tuple[int, str]]:
+    """Магазины как (id, name)."""
+    return [
+        (int(s.id), s.name)
+        for s in list_items(store_crud, limit=_REFS_LIMIT)
+    ]
+
+
+@ttl_cache(60, 'unit')
+def get_measure_types_cached() -> List[str]:
+    """Различные типы единиц измерения по алфавиту."""
+    return list_measure_types()
@@ -1,13 +1,123 @@
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QComboBox, QCompleter
+from typing import Any, Dict, Optional, Sequence
+
+from PyQt6.QtCore import (
+    QIdentityProxyModel,
+    QModelIndex,
+    QSignalBlocker,
+    QStringListModel,
+    Qt,
+)
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QCompleter,
+    QHeaderView,
+    QListView,
+    QTableView,
+)
+
+# Роль с заранее пониженным текстом элемента — по ней ищет completer.
+_LOWER_ROLE = Qt.ItemDataRole.UserRole + 100
+
+# С какого числа элементов combo перестаёт подгонять ширину под текст.
+LARGE_COMBO_ITEMS = 500
+# Ширина большого combo в символах.
+LARGE_COMBO_CHARS = 30
+
+
+class _LowerTextProxy(QIdentityProxyModel):
+    """Отдаёт текст элементов источника в нижнем регистре по _LOWER_ROLE.
+
+    Пониженные строки считаются один раз и сбрасываются при любом
+    изменении источника.
+    """
+
+    def __init__(self, source, parent=None):  # noqa: ANN001
+        super().__init__(parent)
+        self._lowered: Optional[list[str]] = None
+        self.setSourceModel(source)
+        for signal in (
+            source.modelReset,
+            source.rowsInserted,
+            source.rowsRemoved,
+            source.rowsMoved,
+            source.dataChanged,
+            source.layoutChanged,
+        ):
+            signal.connect(self._drop_cache)
+
+    def _drop_cache(self, *args) -> None:
+        self._lowered = None
+
+    def data(
+        self,
+        index: QModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole
+    ):
+        if role != _LOWER_ROLE:
+            return super().data(index, role)
+        if self._lowered is None:
+            src = self.sourceModel()
+            if isinstance(src, QStringListModel):
+                self._lowered = [s.lower() for s in src.stringList()]
+            else:
+                self._lowered = [
+                    str(src.index(r, 0).data() or '').lower()
+                    for r in range(src.rowCount())
+                ]
+        return self._lowered[index.row()]
+
+
+class _LowerCaseCompleter(QCompleter):
+    """Completer, сравнивающий пониженный ввод с пониженными элементами.
+
+    Регистр приводится один раз (у элементов — в модели, у ввода — в
+    splitPath), и сравнение идёт без учёта регистра на каждом элементе.
+    """
+
+    def splitPath(self, path: str) -> list[str]:
+        return [path.lower()]
+
+    def pathFromIndex(self, index: QModelIndex) -> str:
+        return index.data(Qt.ItemDataRole.DisplayRole) or ''
+
+
+def make_search_completer(model, parent=None) -> QCompleter:  # noqa: ANN001
+    """Создаёт completer с поиском по подстроке без учёта регистра.
+
+    Один такой completer можно отдать нескольким комбобоксам с
+    одинаковым набором элементов (см. `shared_completer` в
+    `setup_searchable_combo`): пониженные строки и состояние фильтра
+    у них будут общими.
+
+    Args:
+        model: Модель со списком элементов (первая колонка).
+        parent: Владелец completer; должен жить не меньше комбобоксов.
+
+    Returns:
+        QCompleter: Настроенный completer.
+    """
+    completer = _LowerCaseCompleter(_LowerTextProxy(model, parent), parent)
+    completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+    completer.setCompletionRole(_LOWER_ROLE)
+    completer.setCaseSensitivity(Qt.CaseSensitivity.CaseSensitive)
+    completer.setFilterMode(Qt.MatchFlag.MatchContains)
+    # Строки подсказок одной высоты: список не меряет каждую.
+    popup = completer.popup()
+    if isinstance(popup, QListView):
+        popup.setUniformItemSizes(True)
+    return completer
 
 
 def setup_searchable_combo(
     combo: QComboBox,
     *,
     placeholder: str = '',
+    shared_completer: Optional[QCompleter] = None,
+    items: Optional[Sequence[str]] = None,
 ) -> None:
     """Делает QComboBox удобным для поиска по вводу.
 
@@ -19,6 +129,13 @@ def setup_searchable_combo(
     Args:
         combo: Комбо-бокс, который нужно настроить.
         placeholder: Плейсхолдер для lineEdit.
+        shared_completer: Общий completer из `make_search_completer`
+            для комбобоксов с одинаковыми элементами. Без него
+            создаётся собственный completer поверх модели combo.
+        items: Готовый список подписей для подсказок. Completer тогда
+            ищет по отдельной QStringListModel и не зависит от
+            перезаполнения самого combo; обновлять список —
+            через `set_search_items`.
     """
     combo.setEditable(True)
     combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
@@ -27,15 +144,214 @@ def setup_searchable_combo(
     if le and placeholder:
         le.setPlaceholderText(placeholder)
 
-    completer = QCompleter(combo.model(), combo)
-    completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-    completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-    completer.setFilterMode(Qt.MatchFlag.MatchContains)
+    if shared_completer is not None:
+        completer = shared_completer
+    elif items is not None:
+        completer = make_search_completer(
+            QStringListModel(list(items), combo), combo
+        )
+    else:
+        completer = make_search_completer(combo.model(), combo)
 
     def _activate(text: str) -> None:
+        # Общий completer шлёт activated всем подписанным комбобоксам;
+        # выбор применяет только тот, в котором сейчас идёт ввод.
+        if completer.widget() is not combo:
+            return
         idx = combo.findText(text, Qt.MatchFlag.MatchExactly)
         if idx >= 0:
             combo.setCurrentIndex(idx)
 
     completer.activated[str].connect(_activate)
     combo.setCompleter(completer)
+
+
+def set_search_items(combo: QComboBox, items: Sequence[str]) -> None:
+    """Заменяет список подсказок combo, настроенного с `items`.
+
+    Args:
+        combo: Комбо-бокс после `setup_searchable_combo(..., items=...)`.
+        items: Новые подписи для подсказок.
+    """
+    completer = combo.completer()
+    proxy = completer.model() if completer else None
+    src = proxy.sourceModel() if proxy is not None else None
+    if isinstance(src, QStringListModel):
+        src.setStringList(list(items))
+
+
+def setup_fixed_rows(table: QTableView) -> None:
+    """Задаёт таблице строки одинаковой фиксированной высоты.
+
+    Высота берётся из шрифта, перенос слов выключен, длинный текст
+    обрезается многоточием. Так Qt не спрашивает размер каждой ячейки
+    при прокрутке и перерисовке.
+
+    Args:
+        table: Таблица, которую нужно настроить.
+    """
+    vh = table.verticalHeader()
+    vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    vh.setDefaultSectionSize(vh.fontMetrics().height() + 6)
+
+    table.setWordWrap(False)
+    table.setTextElideMode(Qt.TextElideMode.ElideRight)
+    table.setHorizontalScrollMode(
+        QAbstractItemView.ScrollMode.ScrollPerPixel
+    )
+
+
+def setup_fixed_columns(
+    table: QTableView,
+    keys: Sequence[str],
+    widths: Dict[str, int],
+    *,
+    stretch_key: Optional[str] = None,
+    default_width: int = 120,
+) -> None:
+    """Задаёт колонкам таблицы стартовые ширины без замера содержимого.
+
+    Колонки без ширины в `widths` получают `default_width`; колонка
+    `stretch_key` забирает остаток. Остальные остаются Interactive —
+    пользователь может менять ширину руками, а Qt не измеряет текст
+    ячеек, чтобы подобрать размер.
+
+    Args:
+        table: Таблица (модель уже установлена).
+        keys: Ключи колонок в порядке модели.
+        widths: Ширины {ключ колонки: пиксели}.
+        stretch_key: Ключ растягиваемой колонки.
+        default_width: Ширина колонок, не указанных в `widths`.
+    """
+    header = table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+    header.setDefaultSectionSize(default_width)
+
+    for idx, key in enumerate(keys):
+        width = widths.get(key)
+        if width is not None:
+            table.setColumnWidth(idx, int(width))
+        if key == stretch_key:
+            header.setSectionResizeMode(idx, QHeaderView.ResizeMode.Stretch)
+
+
+def add_combo_items(
+    combo: QComboBox,
+    labels: Sequence[str],
+    data: Sequence[Any],
+) -> None:
+    """Добавляет пачку элементов в QComboBox одной вставкой в модель.
+
+    Элементы собираются заранее (текст + itemData) и уходят в
+    стандартную модель комбобокса одним appendRows: один rowsInserted
+    на всю пачку и ни одного dataChanged. Для нестандартной модели —
+    addItems и itemData с заблокированными сигналами модели.
+
+    Заодно на combo запоминается индекс {itemData: позиция}, по
+    которому `combo_index_of` находит элемент без обхода списка.
+
+    Args:
+        combo: Комбо-бокс.
+        labels: Тексты элементов.
+        data: itemData для каждого элемента (в том же порядке).
+    """
+    start = combo.count()
+    index = _data_index(combo)
+    for i, value in enumerate(data, start=start):
+        # Как findData: при повторах побеждает первый элемент.
+        index.setdefault(value, i)
+
+    model = combo.model()
+    if isinstance(model, QStandardItemModel):
+        user_role = Qt.ItemDataRole.UserRole
+        items = []
+        for label, value in zip(labels, data):
+            item = QStandardItem(label)
+            item.setData(value, user_role)
+            items.append(item)
+        model.invisibleRootItem().appendRows(items)
+    else:
+        combo.addItems(list(labels))
+        blocker = QSignalBlocker(model)
+        try:
+            for i, value in enumerate(data, start=start):
+                combo.setItemData(i, value)
+        finally:
+            blocker.unblock()
+
+    # (число элементов на момент записи, индекс): если combo с тех пор
+    # меняли в обход add_combo_items, индекс не продолжается.
+    combo._data_index = (  # type: ignore[attr-defined]
+        combo.count(), index
+    )
+
+
+def fill_combo(
+    combo: QComboBox,
+    placeholder: str,
+    labels: Sequence[str],
+    data: Sequence[Any],
+) -> None:
+    """Перезаполняет QComboBox: пункт-заглушка с None и элементы.
+
+    Перерисовка combo выключена на время заполнения.
+
+    Args:
+        combo: Комбо-бокс.
+        placeholder: Текст первого пункта (itemData = None).
+        labels: Тексты элементов.
+        data: itemData для каждого элемента (в том же порядке).
+    """
+    combo.setUpdatesEnabled(False)
+    try:
+        combo.clear()
+        combo.addItem(placeholder, None)
+        add_combo_items(combo, labels, data)
+        if len(labels) > LARGE_COMBO_ITEMS:
+            tune_large_combo(combo)
+    finally:
+        combo.setUpdatesEnabled(True)
+
+
+def tune_large_combo(combo: QComboBox) -> None:
+    """Настраивает combo с тысячами элементов.
+
+    По умолчанию QComboBox при первом показе измеряет текст всех
+    элементов, чтобы подобрать ширину, а выпадающий список спрашивает
+    высоту каждой строки. Здесь ширина задаётся в символах
+    (`LARGE_COMBO_CHARS`), а строки списка считаются одной высоты.
+
+    Args:
+        combo: Комбо-бокс.
+    """
+    combo.setSizeAdjustPolicy(
+        QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+    )
+    combo.setMinimumContentsLength(LARGE_COMBO_CHARS)
+    view = combo.view()
+    if isinstance(view, QListView):
+        view.setUniformItemSizes(True)
+
+
+def _data_index(combo: QComboBox) -> Dict[Any, int]:
+    cached = getattr(combo, '_data_index', None)
+    if cached is None or cached[0] != combo.count():
+        return {}
+    return cached[1]
+
+
+def combo_index_of(combo: QComboBox, data: Any) -> int:
+    """Позиция элемента с данным itemData или -1.
+
+    Сначала смотрит индекс из `add_combo_items` и проверяет найденную
+    позицию одним itemData (индекс мог устареть после clear/addItem);
+    иначе ищет через findData.
+
+    Args:
+        combo: Комбо-бокс.
+        data: Искомое itemData.
+    """
+    idx = _data_index(combo).get(data)
+    if idx is not None and combo.itemData(idx) == data:
+        return idx
+    return combo.findData(data)
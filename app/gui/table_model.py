@@ -2,29 +2,356 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Optional
 
 from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
 
+# Роли как простые int: Qt передаёт в data() int, и проверка по
+# frozenset не идёт через сравнение с членами IntEnum.
+_TEXT_ROLES = frozenset((
+    int(Qt.ItemDataRole.DisplayRole),
+    int(Qt.ItemDataRole.EditRole),
+))
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+
+# Разделитель ячеек в строке для поиска: в QLineEdit его не ввести,
+# поэтому подстрока запроса не может «склеить» две соседние ячейки.
+_BLOB_SEP = '\n'
+
+Formatter = Callable[[Any], str]
+
+# Доля общих id, начиная с которой set_rows правит строки точечно,
+# а не сбрасывает модель.
+_PATCH_MIN_OVERLAP = 0.1
+
+
+def _format_default(val: Any) -> str:
+    # Строки (самый частый случай) отдаются как есть, без str().
+    if type(val) is str:
+        return val
+    return '' if val is None else str(val)
+
+
+def _sort_key(val: Any) -> tuple[int, Any]:
+    """Ключ сортировки, который не падает на колонке со смешанными типами.
+
+    Значения сравниваются только внутри своей группы: числа, даты,
+    строки; NaN и прочие типы (по str) идут после них.
+    """
+    if isinstance(val, (int, float, Decimal)):
+        # NaN не равен сам себе; Decimal('NaN') ещё и не сравнивается.
+        return (0, val) if val == val else (5, 0)
+    if isinstance(val, datetime):
+        return (2, val)
+    if isinstance(val, date):
+        return (1, val)
+    if isinstance(val, str):
+        return (3, val)
+    return (4, str(val))
+
+
+def _skip_none(fmt: Formatter) -> Formatter:
+    def _format(val: Any) -> str:
+        return '' if val is None else fmt(val)
+    return _format
+
+
+class SlotRow:
+    """База для строк модели на слотах вместо словаря.
+
+    Строка со `__slots__` меньше словаря и быстрее читается. `get` и
+    `[]` повторяют чтение из словаря, поэтому модель и код вкладок
+    работают с ней как со строкой-dict.
+    """
+
+    __slots__ = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
 
 class DictTableModel(QAbstractTableModel):
+    """Модель таблицы поверх списка словарей.
+
+    Строковые представления ячеек считаются один раз в `set_rows`, чтобы
+    `data()`, который Qt дёргает на каждую перерисовку, был просто
+    обращением к списку. Там же собирается строка для поиска: все ячейки
+    строки, склеенные в одну и приведённые к нижнему регистру.
+
+    `formatters` задаёт форматирование значений отдельных колонок
+    ({ключ: функция}); None форматтер не получает и всегда показывается
+    пустой строкой. Для остальных колонок — str().
+
+    Сортировка (`sort_by`) переставляет сами списки модели и сохраняется
+    при последующих set_rows/append_rows/update_row.
+
+    Строкой может быть и не dict: модели достаточно `row.get(key)` и
+    `row[key]` (см. `SlotRow`).
+    """
+
     def __init__(
         self,
         columns: list[tuple[str, str]],
         rows: Optional[list[dict]] = None,
+        formatters: Optional[dict[str, Formatter]] = None,
     ):
         super().__init__()
         self._columns = columns
+        self._keys = [key for key, _ in columns]
+        formatters = formatters or {}
+        self._formatters: list[tuple[str, Formatter]] = [
+            (
+                key,
+                _skip_none(formatters[key]) if key in formatters
+                else _format_default,
+            )
+            for key in self._keys
+        ]
+        self._headers = [title for _, title in columns]
         self._rows: list[dict] = rows or []
+        self._display: list[list[str]] = self.build_display(self._rows)
+        self._display_lower: list[Optional[list[str]]] = (
+            [None] * len(self._rows)
+        )
+        self._row_blob: list[str] = self._to_blobs(self._display)
+        # (ключ, по возрастанию) или None — порядок как пришёл.
+        self._sort: Optional[tuple[str, bool]] = None
+
+    def _to_display(self, row: dict) -> list[str]:
+        get = row.get
+        return [fmt(get(key)) for key, fmt in self._formatters]
+
+    def build_display(self, rows: list[dict]) -> list[list[str]]:
+        """Строковые значения ячеек для строк (в порядке колонок).
+
+        Не трогает состояние модели, поэтому годится для фонового потока:
+        результат передаётся в `set_rows`/`append_rows` как `display`.
+        """
+        to_display = self._to_display
+        return [to_display(r) for r in rows]
+
+    @staticmethod
+    def _to_blobs(display: list[list[str]]) -> list[str]:
+        return [_BLOB_SEP.join(cells).lower() for cells in display]
 
     def set_rows(
         self,
-        rows: list[dict]
+        rows: list[dict],
+        display: Optional[list[list[str]]] = None,
     ) -> None:
+        """Заменяет строки модели.
+
+        Если у старых и новых строк есть общие `id` (хотя бы
+        `_PATCH_MIN_OVERLAP` от большего набора) и общие идут в том же
+        порядке, модель не сбрасывается: пропавшие строки удаляются,
+        новые вставляются, у изменившихся обновляются ячейки. Так
+        представление перерисовывает только разницу, а выделение и
+        прокрутка остаются на месте.
+        """
+        if display is None:
+            display = self.build_display(rows)
+        order = self._sort_order(rows)
+        if order is not None:
+            rows = [rows[i] for i in order]
+            display = [display[i] for i in order]
+        if self._patch_rows(rows, display):
+            return
+
         self.beginResetModel()
         self._rows = rows
+        self._display = display
+        self._display_lower = [None] * len(rows)
+        self._row_blob = self._to_blobs(self._display)
         self.endResetModel()
 
+    def _patch_rows(
+        self,
+        rows: list[dict],
+        display: list[list[str]],
+    ) -> bool:
+        """Приводит строки модели к `rows` вставками и удалениями.
+
+        Returns:
+            bool: False, если точечная правка не подходит и модель
+            нужно сбросить целиком.
+        """
+        old_ids = [r.get('id') for r in self._rows]
+        new_ids = [r.get('id') for r in rows]
+        if not old_ids or not new_ids:
+            return False
+        new_set = set(new_ids)
+        old_set = set(old_ids)
+        if (
+            None in new_set
+            or None in old_set
+            or len(new_set) != len(new_ids)
+            or len(old_set) != len(old_ids)
+        ):
+            return False
+        kept = [i for i in old_ids if i in new_set]
+        if len(kept) < _PATCH_MIN_OVERLAP * max(len(old_ids), len(new_ids)):
+            return False
+        if [i for i in new_ids if i in old_set] != kept:
+            return False
+
+        # Удаляем пропавшие строки снизу вверх, сплошными участками.
+        end = len(old_ids) - 1
+        while end >= 0:
+            if old_ids[end] in new_set:
+                end -= 1
+                continue
+            start = end
+            while start > 0 and old_ids[start - 1] not in new_set:
+                start -= 1
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self._rows[start:end + 1]
+            del self._display[start:end + 1]
+            del self._display_lower[start:end + 1]
+            del self._row_blob[start:end + 1]
+            self.endRemoveRows()
+            end = start - 1
+
+        # Теперь в модели только общие строки и в нужном порядке:
+        # вставляем новые между ними и обновляем изменившиеся.
+        pos = 0
+        changed: list[int] = []
+        while pos < len(rows):
+            if pos < len(self._rows) and self._rows[pos].get('id') == (
+                new_ids[pos]
+            ):
+                self._rows[pos] = rows[pos]
+                if self._display[pos] != display[pos]:
+                    self._display[pos] = display[pos]
+                    self._display_lower[pos] = None
+                    self._row_blob[pos] = self._to_blobs([display[pos]])[0]
+                    changed.append(pos)
+                pos += 1
+                continue
+            end = pos
+            while end < len(rows) and new_ids[end] not in old_set:
+                end += 1
+            self.beginInsertRows(QModelIndex(), pos, end - 1)
+            self._rows[pos:pos] = rows[pos:end]
+            self._display[pos:pos] = display[pos:end]
+            self._display_lower[pos:pos] = [None] * (end - pos)
+            self._row_blob[pos:pos] = self._to_blobs(display[pos:end])
+            self.endInsertRows()
+            pos = end
+
+        last_col = len(self._columns) - 1
+        for row_index in changed:
+            self.dataChanged.emit(
+                self.index(row_index, 0),
+                self.index(row_index, last_col),
+            )
+        return True
+
+    def sort_by(self, key: str, ascending: bool = True) -> None:
+        """Сортирует строки по значению `key`; пустые значения — в конце.
+
+        Сравниваются исходные значения строк (числа как числа), а не
+        их отображение. В колонке со смешанными типами значения
+        группируются по типу (см. `_sort_key`).
+        """
+        self._sort = (key, ascending)
+        self._resort()
+
+    def _sort_order(self, rows: list[dict]) -> Optional[list[int]]:
+        """Порядок `rows` по текущей сортировке или None, если он
+        не меняется."""
+        if self._sort is None:
+            return None
+        key, ascending = self._sort
+        present = [i for i, r in enumerate(rows) if r.get(key) is not None]
+        missing = [i for i, r in enumerate(rows) if r.get(key) is None]
+        present.sort(
+            key=lambda i: _sort_key(rows[i][key]), reverse=not ascending
+        )
+        order = present + missing
+        if order == list(range(len(rows))):
+            return None
+        return order
+
+    def _permute(self, order: list[int]) -> None:
+        self._rows = [self._rows[i] for i in order]
+        self._display = [self._display[i] for i in order]
+        self._display_lower = [self._display_lower[i] for i in order]
+        self._row_blob = [self._row_blob[i] for i in order]
+
+    def _resort(self) -> None:
+        """Пересортировывает строки, сохраняя выделение в представлении."""
+        order = self._sort_order(self._rows)
+        if order is None:
+            return
+        self.layoutAboutToBeChanged.emit()
+        new_pos = [0] * len(order)
+        for new, old in enumerate(order):
+            new_pos[old] = new
+        self._permute(order)
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(new_pos[i.row()], i.column()) for i in persistent],
+        )
+        self.layoutChanged.emit()
+
+    def append_rows(
+        self,
+        rows: list[dict],
+        display: Optional[list[list[str]]] = None,
+    ) -> None:
+        """Дописывает строки в конец без сброса модели.
+
+        Представление и proxy получают rowsInserted и обрабатывают только
+        новые строки; выделение и прокрутка сохраняются.
+        """
+        if not rows:
+            return
+        first = len(self._rows)
+        if display is None:
+            display = self.build_display(rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._display.extend(display)
+        self._display_lower.extend([None] * len(rows))
+        self._row_blob.extend(self._to_blobs(display))
+        self.endInsertRows()
+        self._resort()
+
+    def append_row(self, row: dict) -> None:
+        """Дописывает одну строку в конец."""
+        self.append_rows([row])
+
+    def update_row(self, row_index: int, row: dict) -> None:
+        """Заменяет строку и сообщает об изменении только её ячеек."""
+        display = self._to_display(row)
+        self._rows[row_index] = row
+        self._display[row_index] = display
+        self._display_lower[row_index] = None
+        self._row_blob[row_index] = self._to_blobs([display])[0]
+        self.dataChanged.emit(
+            self.index(row_index, 0),
+            self.index(row_index, len(self._columns) - 1),
+        )
+        self._resort()
+
+    def remove_row(self, row_index: int) -> None:
+        """Удаляет одну строку без сброса модели."""
+        self.beginRemoveRows(QModelIndex(), row_index, row_index)
+        del self._rows[row_index]
+        del self._display[row_index]
+        del self._display_lower[row_index]
+        del self._row_blob[row_index]
+        self.endRemoveRows()
+
     def rowCount(
         self,
         parent: QModelIndex = QModelIndex()
@@ -42,18 +369,14 @@ class DictTableModel(QAbstractTableModel):
         index: QModelIndex,
         role: int = Qt.ItemDataRole.DisplayRole
     ):
-        if not index.isValid():
+        if role not in _TEXT_ROLES:
             return None
-        if role not in (
-            Qt.ItemDataRole.DisplayRole,
-            Qt.ItemDataRole.EditRole
-        ):
+        # row() < 0 у невалидного индекса: проверка без отдельного
+        # вызова isValid().
+        row = index.row()
+        if row < 0:
             return None
-
-        row = self._rows[index.row()]
-        key = self._columns[index.column()][0]
-        val = row.get(key)
-        return '' if val is None else str(val)
+        return self._display[row][index.column()]
 
     def headerData(
         self,
@@ -61,11 +384,37 @@ class DictTableModel(QAbstractTableModel):
         orientation: Qt.Orientation,
         role: int = Qt.ItemDataRole.DisplayRole
     ):
-        if role != Qt.ItemDataRole.DisplayRole:
+        if role != _DISPLAY_ROLE:
             return None
         if orientation == Qt.Orientation.Horizontal:
-            return self._columns[section][1]
+            return self._headers[section]
         return str(section + 1)
 
     def row_dict(self, row_index: int) -> dict:
         return self._rows[row_index]
+
+    def display_row(self, row_index: int) -> list[str]:
+        """Строковые значения ячеек строки в порядке колонок."""
+        return self._display[row_index]
+
+    def display_row_lower(self, row_index: int) -> list[str]:
+        """То же, что display_row, но без краевых пробелов и в нижнем
+        регистре — в таком виде ячейки сравнивает фильтр на равенство.
+
+        Считается лениво при первом обращении и кешируется до следующего
+        set_rows, чтобы фильтр не нормализовал ячейки на каждое нажатие.
+        """
+        lowered = self._display_lower[row_index]
+        if lowered is None:
+            lowered = [
+                cell.strip().lower() for cell in self._display[row_index]
+            ]
+            self._display_lower[row_index] = lowered
+        return lowered
+
+    def row_blob(self, row_index: int) -> str:
+        """Все ячейки строки одной строкой в нижнем регистре.
+
+        Текстовый поиск по всем колонкам сводится к одному `in`.
+        """
+        return self._row_blob[row_index]
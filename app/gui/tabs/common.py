@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple, cast
-
-from PyQt6.QtCore import QSortFilterProxyModel, Qt
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from PyQt6.QtCore import (
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QRunnable,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QComboBox,
     QDialog,
     QDialogButtonBox,
     QFormLayout,
     QHBoxLayout,
-    QHeaderView,
     QLabel,
     QLineEdit,
     QMessageBox,
@@ -20,11 +30,19 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from app.gui.qt_helpers import (
+    combo_index_of,
+    setup_fixed_columns,
+    setup_fixed_rows,
+)
 from app.gui.table_model import DictTableModel
 from app.service.crud_service import (
     create_item,
     delete_item,
+    get_item,
+    iter_items,
     list_items,
+    list_page,
     update_item,
 )
 from app.validate.exceptions import ObjectInUseError
@@ -37,8 +55,16 @@ def set_combo_by_data(combo, data: Any) -> None:
         combo: Комбо-бокс.
         data: Значение itemData, которое нужно выбрать.
     """
+    if data is not None:
+        # Индекс из add_combo_items или поиск на стороне Qt — без
+        # itemData() на каждый элемент.
+        idx = combo_index_of(combo, data)
+        if idx >= 0:
+            combo.setCurrentIndex(idx)
+        return
+
     for i in range(combo.count()):
-        if combo.itemData(i) == data:
+        if combo.itemData(i) is None:
             combo.setCurrentIndex(i)
             return
 
@@ -56,62 +82,259 @@ def list_items_safe(crud, *, limit: int = 2000):
     return list_items(crud, limit=limit)
 
 
+def setup_crud_table(table: QTableView) -> None:
+    """Настраивает таблицу CRUD-вкладки: выбор одной строки целиком.
+
+    Args:
+        table: Таблица вкладки.
+    """
+    table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+    table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+    setup_fixed_rows(table)
+
+
+def build_crud_row(tab) -> QHBoxLayout:
+    """Собирает ряд кнопок Добавить/Редактировать/Удалить.
+
+    Args:
+        tab: Вкладка с методами on_add, on_edit и on_delete.
+
+    Returns:
+        QHBoxLayout: Ряд кнопок с растяжкой в конце.
+    """
+    row = QHBoxLayout()
+    for text, slot in (
+        ('Добавить', tab.on_add),
+        ('Редактировать', tab.on_edit),
+        ('Удалить', tab.on_delete),
+    ):
+        btn = QPushButton(text)
+        btn.clicked.connect(slot)
+        row.addWidget(btn)
+    row.addStretch(1)
+    return row
+
+
+class _PageLoaderSignals(QObject):
+    # (поколение reload, строки, их отображение, курсор)
+    chunk_ready = pyqtSignal(int, list, list, object)
+    # (поколение reload, есть ли ещё страницы)
+    done = pyqtSignal(int, bool)
+    failed = pyqtSignal(int, str)
+
+
+class _PageLoader(QRunnable):
+    """Читает строки вкладки в пуле потоков порциями.
+
+    Запрос к БД, превращение объектов в строки таблицы и расчёт их
+    строкового отображения идут вне GUI-потока. Каждая порция уходит
+    сигналом сразу, так что первые строки видны до конца чтения.
+    Между порциями проверяется `cancel()`.
+    """
+
+    def __init__(
+        self,
+        crud,
+        *,
+        generation: int,
+        limit: int,
+        chunk: int,
+        to_rows: Callable[[List[Any]], List[Dict[str, Any]]],
+        to_display: Callable[[List[Dict[str, Any]]], List[List[str]]],
+        after_id: Optional[int] = None,
+    ):
+        super().__init__()
+        self.signals = _PageLoaderSignals()
+        self._crud = crud
+        self._generation = generation
+        self._limit = limit
+        self._chunk = chunk
+        self._to_rows = to_rows
+        self._to_display = to_display
+        self._after_id = after_id
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def run(self) -> None:
+        loaded = 0
+        try:
+            for items in iter_items(
+                self._crud,
+                chunk=self._chunk,
+                limit=self._limit,
+                after_id=self._after_id,
+            ):
+                if self._cancelled.is_set():
+                    return
+                rows = self._to_rows(items)
+                display = self._to_display(rows)
+                loaded += len(items)
+                self.signals.chunk_ready.emit(
+                    self._generation, rows, display, int(items[-1].id)
+                )
+        except Exception as e:
+            self.signals.failed.emit(self._generation, str(e))
+            return
+        self.signals.done.emit(self._generation, loaded == self._limit)
+
+
 class MultiFilterProxyModel(QSortFilterProxyModel):
     """Proxy-модель с несколькими фильтрами.
 
     - text: подстрочный поиск по всем колонкам (case-insensitive)
     - equals_filters: точное совпадение по заданным колонкам
+
+    Источник — DictTableModel: строки читаются напрямую из его кеша
+    отображаемых значений, без QModelIndex и data() на каждую ячейку.
+
+    Если новый текст продолжает прежний (пользователь дописал символ),
+    проверяются только строки, прошедшие предыдущий фильтр: остальные
+    заведомо не подходят.
     """
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._text: str = ''
         self._equals_filters: dict[int, Optional[str]] = {}
+        self._equals_pairs: list[tuple[int, str]] = []
+        # Строки источника, прошедшие последний полный проход фильтра.
+        # None — набор неизвестен или устарел (источник перестроен).
+        self._accepted: Optional[set[int]] = None
+        # Кандидаты для текущего прохода; None — проверять все строки.
+        self._candidates: Optional[set[int]] = None
+        self._source: Optional[DictTableModel] = None
         self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.setFilterKeyColumn(-1)
 
+    def setSourceModel(self, model) -> None:  # noqa: ANN001
+        super().setSourceModel(model)
+        # Python-ссылка на источник: sourceModel() на каждой строке
+        # обходится в лишний вызов через обёртку Qt.
+        self._source = model
+        if model is None:
+            return
+        # Индексы строк меняются — набор прошедших строк больше не верен.
+        for signal in (
+            model.modelAboutToBeReset,
+            model.rowsAboutToBeInserted,
+            model.rowsAboutToBeRemoved,
+            model.layoutAboutToBeChanged,
+        ):
+            signal.connect(self._forget_accepted)
+
+    def _forget_accepted(self, *args) -> None:
+        self._accepted = None
+
+    def _refilter(self, candidates: Optional[set[int]] = None) -> None:
+        self._candidates = candidates
+        # Без фильтров проходят все строки — запоминать нечего.
+        self._accepted = (
+            set() if self._text or self._equals_pairs else None
+        )
+        try:
+            self.invalidateFilter()
+        finally:
+            self._candidates = None
+
     def set_text(self, text: str) -> None:
-        self._text = (text or '').strip().lower()
-        self.invalidateFilter()
+        text = (text or '').strip().lower()
+        narrowing = (
+            self._accepted is not None and text.startswith(self._text)
+        )
+        self._text = text
+        self._refilter(self._accepted if narrowing else None)
+
+    def set_filters(
+        self,
+        text: str,
+        equals: Dict[int, Optional[str]],
+    ) -> None:
+        """Задаёт текст и все equals-фильтры разом, одним проходом.
+
+        Если после нормализации ничего не изменилось, фильтр не
+        пересчитывается: proxy и так следит за изменениями источника.
+        """
+        text = (text or '').strip().lower()
+        normalized = {
+            col: value.strip().lower() if isinstance(value, str) else None
+            for col, value in equals.items()
+        }
+        same_equals = normalized == self._equals_filters
+        if same_equals and text == self._text:
+            return
+
+        narrowing = (
+            same_equals
+            and self._accepted is not None
+            and text.startswith(self._text)
+        )
+        self._text = text
+        if not same_equals:
+            self._equals_filters = normalized
+            self._rebuild_equals_pairs()
+        self._refilter(self._accepted if narrowing else None)
 
     def set_equals_filter(self, column: int, value: Optional[str]) -> None:
+        # Храним уже нормализованное значение: сравнение со строкой
+        # модели идёт без повторных strip/lower.
         self._equals_filters[column] = (
-            value.strip() if isinstance(value, str) else None
+            value.strip().lower() if isinstance(value, str) else None
         )
-        self.invalidateFilter()
+        self._rebuild_equals_pairs()
+        self._refilter()
 
     def clear_equals_filters(self) -> None:
         self._equals_filters.clear()
-        self.invalidateFilter()
+        self._rebuild_equals_pairs()
+        self._refilter()
 
-    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+    def _rebuild_equals_pairs(self) -> None:
+        """Готовит список (колонка, ожидаемое значение) для фильтрации.
+
+        Пустые фильтры и колонки вне модели отбрасываются здесь, а не
+        на каждой строке.
+        """
         m = self.sourceModel()
-        if m is None:
+        col_count = m.columnCount() if m is not None else 0
+        self._equals_pairs = [
+            (col, expected)
+            for col, expected in self._equals_filters.items()
+            if expected is not None and 0 <= col < col_count
+        ]
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        text = self._text
+        pairs = self._equals_pairs
+        m = self._source
+        if m is None or not (text or pairs):
             return True
 
-        col_count = m.columnCount()
+        candidates = self._candidates
+        if candidates is not None and source_row not in candidates:
+            return False
+
+        accepted = True
 
         # equals filters
-        for col, expected in self._equals_filters.items():
-            if expected is None:
-                continue
-            if col < 0 or col >= col_count:
-                continue
-            idx = m.index(source_row, col, source_parent)
-            actual = m.data(idx)
-            if str(actual).strip().lower() != str(expected).strip().lower():
-                return False
+        if pairs:
+            row = m.display_row_lower(source_row)
+            for col, expected in pairs:
+                if row[col] != expected:
+                    accepted = False
+                    break
 
         # text filter (contains in any column)
-        if self._text:
-            for col in range(col_count):
-                idx = m.index(source_row, col, source_parent)
-                val = m.data(idx)
-                if self._text in str(val).lower():
-                    return True
-            return False
+        if accepted and text:
+            accepted = text in m.row_blob(source_row)
 
-        return True
+        if self._accepted is not None:
+            if accepted:
+                self._accepted.add(source_row)
+            else:
+                self._accepted.discard(source_row)
+        return accepted
 
 
 class NameDescDialog(QDialog):
@@ -160,6 +383,16 @@ class NameDescDialog(QDialog):
             return
         self.accept()
 
+    def reset_fields(self) -> None:
+        """Очищает поля для повторного открытия на добавление."""
+        self.name_edit.clear()
+        self.desc_edit.clear()
+
+    def populate(self, row: Dict[str, Any]) -> None:
+        """Заполняет поля значениями строки таблицы."""
+        self.name_edit.setText(str(row.get('name') or ''))
+        self.desc_edit.setPlainText(str(row.get('description') or ''))
+
     def values(self) -> Tuple[str, Optional[str]]:
         """Возвращает значения формы.
 
@@ -217,6 +450,16 @@ class UnitDialog(QDialog):
 
         self.accept()
 
+    def reset_fields(self) -> None:
+        """Очищает поля для повторного открытия на добавление."""
+        self.measure_type_edit.clear()
+        self.unit_edit.clear()
+
+    def populate(self, row: Dict[str, Any]) -> None:
+        """Заполняет поля значениями строки таблицы."""
+        self.measure_type_edit.setText(str(row.get('measure_type') or ''))
+        self.unit_edit.setText(str(row.get('unit') or ''))
+
     def values(self) -> Tuple[str, str]:
         """Возвращает значения формы."""
         measure_type = self.measure_type_edit.text().strip()
@@ -233,13 +476,22 @@ class BaseCrudTab(QWidget):
     crud = None
     columns: List[Tuple[str, str]] = []
     list_limit: int = 500
+    # Строки подгружаются страницами по мере прокрутки (не больше
+    # list_limit всего).
+    page_size: int = 200
+    # Первая страница приходит из фонового потока порциями такого размера.
+    stream_chunk: int = 50
     delete_guards: Optional[List[Any]] = None
+    # Форматирование значений колонок: {column_key: value -> str}
+    display_formatters: Dict[str, Callable[[Any], str]] = {}
 
     # Включает ленту (как у покупок)
     enable_filter_bar: bool = False
 
     # Настройка поиска
     search_placeholder: str = 'Поиск…'
+    # Пауза после последнего нажатия, после которой применяется поиск
+    search_debounce_ms: int = 150
 
     # Сортировка: список (label, (column_key, direction))
     # direction: 'asc'|'desc'
@@ -250,40 +502,71 @@ class BaseCrudTab(QWidget):
 
         # --- table + model ---
         self.table = QTableView()
-        self.model = DictTableModel(columns=self.columns, rows=[])
+        self.model = DictTableModel(
+            columns=self.columns,
+            rows=[],
+            formatters=self.display_formatters,
+        )
+        self._col_index_map: Dict[str, int] = {
+            key: idx for idx, (key, _) in enumerate(self.columns)
+        }
 
         self.proxy = MultiFilterProxyModel(self)
         self.proxy.setSourceModel(self.model)
 
         self.table.setModel(self.proxy)
-        self.table.setSelectionBehavior(
-            QTableView.SelectionBehavior.SelectRows
-        )
-        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        setup_crud_table(self.table)
         self._apply_column_widths()
 
+        # Текущая строка в координатах модели. Persistent-индекс сам
+        # следует за перестановками и удалением строк в модели.
+        self._current_source = QPersistentModelIndex()
+        self.table.selectionModel().currentChanged.connect(
+            self._on_current_changed
+        )
+
+        # Курсор следующей страницы: id последней загруженной записи.
+        self._next_cursor: Optional[int] = None
+        self._has_more = False
+        # id записей, добавленных в конец таблицы раньше своей страницы:
+        # когда догрузка принесёт их, дубли отбрасываются.
+        self._added_ids: set[int] = set()
+        # Диалог добавления/редактирования создаётся один раз и
+        # переиспользуется (см. _reuse_dialog).
+        self._dialog: Optional[QDialog] = None
+        # Последний применённый вариант сортировки (column_key, direction)
+        self._last_sort: Optional[Tuple[str, str]] = None
+
+        # Номер последнего запущенного reload: ответы старых загрузок
+        # отбрасываются.
+        self._reload_generation = 0
+        self._loader: Optional[_PageLoader] = None
+        self._first_chunk = True
+        self.table.verticalScrollBar().valueChanged.connect(
+            self._on_table_scrolled
+        )
+
         # --- CRUD buttons ---
-        btn_add = QPushButton('Добавить')
-        btn_edit = QPushButton('Редактировать')
-        btn_del = QPushButton('Удалить')
-        btn_refresh = QPushButton('Обновить')
-
-        btn_add.clicked.connect(self.on_add)
-        btn_edit.clicked.connect(self.on_edit)
-        btn_del.clicked.connect(self.on_delete)
-        btn_refresh.clicked.connect(self.reload)
-
-        crud_row = QHBoxLayout()
-        crud_row.addWidget(btn_add)
-        crud_row.addWidget(btn_edit)
-        crud_row.addWidget(btn_del)
-        crud_row.addStretch(1)
-        crud_row.addWidget(btn_refresh)
+        self.btn_refresh = QPushButton('Обновить')
+        self.btn_refresh.clicked.connect(self.reload)
+
+        crud_row = build_crud_row(self)
+        crud_row.addWidget(self.btn_refresh)
 
         # --- Filter / Sort bar (как у покупок) ---
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText(self.search_placeholder)
 
+        # Поиск по мере ввода: серия нажатий схлопывается в один проход
+        # фильтра после паузы search_debounce_ms.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.search_debounce_ms)
+        self._search_timer.timeout.connect(self.apply_filters)
+        self.search_edit.textChanged.connect(
+            lambda _text: self._search_timer.start()
+        )
+
         self.sort_combo = QComboBox()
         for label, data in self.sort_options:
             self.sort_combo.addItem(label, data)
@@ -339,17 +622,54 @@ class BaseCrudTab(QWidget):
     # ====== internal helpers ======
 
     def _col_index(self, key: str) -> Optional[int]:
-        for idx, (k, _) in enumerate(self.columns):
-            if k == key:
-                return idx
-        return None
+        return self._col_index_map.get(key)
+
+    def _on_current_changed(
+        self,
+        current: QModelIndex,
+        _previous: QModelIndex,
+    ) -> None:
+        self._current_source = QPersistentModelIndex(
+            self.proxy.mapToSource(current)
+        )
+
+    def _selected_source_row(self) -> Optional[int]:
+        src = self._current_source
+        return src.row() if src.isValid() else None
 
     def _selected_row(self) -> Optional[Dict[str, Any]]:
-        idx = self.table.currentIndex()
-        if not idx.isValid():
+        src_row = self._selected_source_row()
+        if src_row is None:
             return None
-        src = self.proxy.mapToSource(idx)
-        return cast(Dict[str, Any], self.model.row_dict(src.row()))
+        return cast(Dict[str, Any], self.model.row_dict(src_row))
+
+    def _reuse_dialog(self, row: Optional[Dict[str, Any]]) -> QDialog:
+        """Возвращает диалог для добавления (row=None) или правки.
+
+        Диалоги с методами reset_fields/populate создаются один раз на
+        вкладку и при следующих открытиях только перезаполняются.
+        Остальные строятся заново через make_add_dialog/make_edit_dialog.
+        """
+        dlg = self._dialog
+        if dlg is None:
+            dlg = (
+                self.make_add_dialog() if row is None
+                else self.make_edit_dialog(row)
+            )
+            if hasattr(dlg, 'reset_fields') and hasattr(dlg, 'populate'):
+                self._dialog = dlg
+            return dlg
+
+        if row is None:
+            dlg.reset_fields()
+        else:
+            dlg.populate(row)
+        return dlg
+
+    def _fetch_row(self, item_id: int) -> Dict[str, Any]:
+        """Читает одну запись из БД и превращает её в строку таблицы."""
+        item = get_item(self.crud, item_id, with_relations=True)
+        return self.items_to_rows([item])[0]
 
     def _info_select_row(self) -> None:
         QMessageBox.information(
@@ -360,55 +680,48 @@ class BaseCrudTab(QWidget):
 
     def _apply_column_widths(self) -> None:
         """Применяет стартовые ширины колонок и режимы ресайза."""
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-
-        widths = getattr(self, 'column_widths', {})
-        stretch_key = getattr(self, 'stretch_column', None)
-
-        for col_idx, (key, _) in enumerate(self.columns):
-            if key in widths:
-                self.table.setColumnWidth(col_idx, int(widths[key]))
-
-        if stretch_key:
-            for col_idx, (key, _) in enumerate(self.columns):
-                if key == stretch_key:
-                    header.setSectionResizeMode(
-                        col_idx,
-                        QHeaderView.ResizeMode.Stretch
-                    )
-                    break
+        setup_fixed_columns(
+            self.table,
+            list(self._col_index_map),
+            getattr(self, 'column_widths', {}),
+            stretch_key=getattr(self, 'stretch_column', None),
+        )
 
     # ====== filtering/sorting ======
 
     def apply_filters(self) -> None:
         """Применяет фильтры + сортировку к proxy."""
+        # Явное применение (кнопка, сброс, reload) отменяет отложенное.
+        self._search_timer.stop()
         if not self.enable_filter_bar:
             return
 
-        # text
-        self.proxy.set_text(self.search_edit.text())
-
-        # equals filters
-        self.proxy.clear_equals_filters()
+        # Поиск и фильтры должны видеть всю таблицу, а не только
+        # прокрученную часть. Остаток дочитывается в фоне; proxy
+        # фильтрует строки по мере их прихода.
+        if self.search_edit.text().strip() or any(
+            val is not None for val in self.get_equals_filters().values()
+        ):
+            self._load_rest_in_background()
+
+        # text + equals filters: один проход proxy, и только если
+        # что-то поменялось
+        equals: Dict[int, Optional[str]] = {}
         for col_key, val in self.get_equals_filters().items():
             col_idx = self._col_index(col_key)
-            if col_idx is None:
-                continue
-            self.proxy.set_equals_filter(col_idx, val)
+            if col_idx is not None:
+                equals[col_idx] = val
+        self.proxy.set_filters(self.search_edit.text(), equals)
 
-        # sort
+        # sort: переставляем строки в самой модели, proxy не сортирует.
+        # Модель сама держит выбранный порядок при новых строках, так что
+        # повторно сортируем только при смене варианта.
         data = self.sort_combo.currentData()
-        if data:
+        if data and data != self._last_sort:
             col_key, direction = data
-            col_idx = self._col_index(col_key)
-            if col_idx is not None:
-                order = (
-                    Qt.SortOrder.AscendingOrder
-                    if direction == 'asc'
-                    else Qt.SortOrder.DescendingOrder
-                )
-                self.proxy.sort(col_idx, order)
+            if self._col_index(col_key) is not None:
+                self.model.sort_by(col_key, ascending=direction == 'asc')
+                self._last_sort = data
 
     def on_reset_filters(self) -> None:
         if not self.enable_filter_bar:
@@ -424,21 +737,151 @@ class BaseCrudTab(QWidget):
     # ====== CRUD actions ======
 
     def reload(self) -> None:
-        items = list_items(self.crud, limit=self.list_limit)
-        self.model.set_rows(self.items_to_rows(items))
+        """Перечитывает первую страницу в фоне, не блокируя окно."""
+        if self._loader is not None:
+            self._loader.cancel()
+        self._reload_generation += 1
+        # До конца загрузки догружать нечего: курсор ещё не известен.
+        self._next_cursor = None
+        self._has_more = False
+        self._added_ids.clear()
+        self._first_chunk = True
+        self.btn_refresh.setEnabled(False)
+
+        self._start_loader(limit=min(self.page_size, self.list_limit))
+
+    def _start_loader(
+        self,
+        *,
+        limit: int,
+        after_id: Optional[int] = None,
+    ) -> None:
+        """Запускает фоновую загрузку строк текущего поколения."""
+        loader = _PageLoader(
+            self.crud,
+            generation=self._reload_generation,
+            limit=limit,
+            chunk=self.stream_chunk,
+            to_rows=self.items_to_rows,
+            to_display=self.model.build_display,
+            after_id=after_id,
+        )
+        loader.signals.chunk_ready.connect(self._on_reload_chunk)
+        loader.signals.done.connect(self._on_reload_done)
+        loader.signals.failed.connect(self._on_reload_failed)
+        self._loader = loader
+        QThreadPool.globalInstance().start(loader)
+
+    def _load_rest_in_background(self) -> None:
+        """Дочитывает все оставшиеся страницы в фоне.
+
+        Пока загрузка идёт, повторный вызов ничего не делает, а
+        прокрутка не догружает страницы сама: курсор двигает загрузчик.
+        """
+        if self._loader is not None or not self._has_more:
+            return
+        limit = self.list_limit - self.model.rowCount()
+        self._has_more = False
+        if limit <= 0:
+            return
+        self.btn_refresh.setEnabled(False)
+        self._start_loader(limit=limit, after_id=self._next_cursor)
+
+    def _on_reload_chunk(
+        self,
+        generation: int,
+        rows: List[Dict[str, Any]],
+        display: List[List[str]],
+        cursor: int,
+    ) -> None:
+        if generation != self._reload_generation:
+            return
+        self._next_cursor = cursor
+        if self._first_chunk:
+            self._first_chunk = False
+            self.model.set_rows(rows, display)
+            self.apply_filters()
+        else:
+            rows, display = self._skip_added(rows, display)
+            self.model.append_rows(rows, display)
+
+    def _on_reload_done(self, generation: int, has_more: bool) -> None:
+        if generation != self._reload_generation:
+            return
+        self._loader = None
+        self._has_more = has_more
+        if self._first_chunk:
+            # Таблица пуста — ни одной порции не пришло.
+            self._first_chunk = False
+            self.model.set_rows([])
+        # Повторно: активный фильтр теперь может догрузить остальное.
         self.apply_filters()
+        self.btn_refresh.setEnabled(True)
+
+    def _on_reload_failed(self, generation: int, message: str) -> None:
+        if generation != self._reload_generation:
+            return
+        self._loader = None
+        self.btn_refresh.setEnabled(True)
+        QMessageBox.critical(self, 'Ошибка', message)
+
+    def _fetch_next_page(self) -> List[Dict[str, Any]]:
+        """Читает следующую страницу и сдвигает курсор."""
+        limit = min(self.page_size, self.list_limit - self.model.rowCount())
+        if not self._has_more or limit <= 0:
+            self._has_more = False
+            return []
+
+        items = list_page(self.crud, after_id=self._next_cursor, limit=limit)
+        self._has_more = len(items) == limit
+        if items:
+            self._next_cursor = int(items[-1].id)
+        return self.items_to_rows(items)
+
+    def _skip_added(
+        self,
+        rows: List[Dict[str, Any]],
+        display: Optional[List[List[str]]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[List[List[str]]]]:
+        """Убирает из страницы строки, которые on_add уже добавил."""
+        if not self._added_ids:
+            return rows, display
+        keep = [
+            i for i, row in enumerate(rows)
+            if row.get('id') not in self._added_ids
+        ]
+        self._added_ids.difference_update(row.get('id') for row in rows)
+        if len(keep) == len(rows):
+            return rows, display
+        rows = [rows[i] for i in keep]
+        if display is not None:
+            display = [display[i] for i in keep]
+        return rows, display
+
+    def _load_more(self) -> None:
+        rows, _ = self._skip_added(self._fetch_next_page())
+        self.model.append_rows(rows)
+
+    def _on_table_scrolled(self, value: int) -> None:
+        """Подгружает страницу, когда до конца таблицы меньше экрана."""
+        bar = self.table.verticalScrollBar()
+        if self._has_more and value >= bar.maximum() - bar.pageStep():
+            self._load_more()
 
     def pre_add_check(self) -> Optional[str]:
         return None
 
     def items_to_rows(self, items: List[Any]) -> List[Dict[str, Any]]:
-        rows: List[Dict[str, Any]] = []
-        for item in items:
-            if hasattr(item, 'to_dict') and callable(item.to_dict):
-                rows.append(item.to_dict())
-            else:
-                rows.append(dict(item.__dict__))
-        return rows
+        """Превращает ORM-объекты в строки таблицы.
+
+        Вызывается и из фонового потока загрузки: не должен трогать
+        виджеты.
+        """
+        return [
+            to_dict() if callable(to_dict := getattr(item, 'to_dict', None))
+            else dict(item.__dict__)
+            for item in items
+        ]
 
     def make_add_dialog(self) -> QDialog:
         raise NotImplementedError
@@ -462,39 +905,50 @@ class BaseCrudTab(QWidget):
             QMessageBox.warning(self, 'Нельзя', msg)
             return
 
-        dlg = self.make_add_dialog()
+        dlg = self._reuse_dialog(None)
         if dlg.exec() != QDialog.DialogCode.Accepted:
             return
 
         try:
             obj = self.build_create_obj(dlg)
-            create_item(self.crud, obj)
-            self.reload()
+            created = create_item(self.crud, obj)
+            if self._loader is not None:
+                # Идёт загрузка: новая запись может прийти с ней же.
+                self.reload()
+            else:
+                # Запись сразу добавляется в конец. У неё наибольший id,
+                # так что с догрузкой она придёт на последней странице —
+                # там дубль отбросит _skip_added.
+                self.model.append_row(self._fetch_row(int(created.id)))
+                if self._has_more:
+                    self._added_ids.add(int(created.id))
         except Exception as e:
             QMessageBox.critical(self, 'Ошибка', str(e))
 
     def on_edit(self) -> None:
-        row = self._selected_row()
-        if not row:
+        src_row = self._selected_source_row()
+        if src_row is None:
             self._info_select_row()
             return
+        row = self.model.row_dict(src_row)
 
-        dlg = self.make_edit_dialog(row)
+        dlg = self._reuse_dialog(row)
         if dlg.exec() != QDialog.DialogCode.Accepted:
             return
 
         try:
             fields = self.build_update_fields(dlg)
             update_item(self.crud, int(row['id']), **fields)
-            self.reload()
+            self.model.update_row(src_row, self._fetch_row(int(row['id'])))
         except Exception as e:
             QMessageBox.critical(self, 'Ошибка', str(e))
 
     def on_delete(self) -> None:
-        row = self._selected_row()
-        if not row:
+        src_row = self._selected_source_row()
+        if src_row is None:
             self._info_select_row()
             return
+        row = self.model.row_dict(src_row)
 
         label = self.delete_label(row)
         ok = QMessageBox.question(
@@ -510,7 +964,7 @@ class BaseCrudTab(QWidget):
                 self.crud,
                 int(row['id']
             ), guards=list(self.delete_guards or []))
-            self.reload()
+            self.model.remove_row(src_row)
         except ObjectInUseError as e:
             QMessageBox.warning(self, 'Нельзя удалить', str(e))
         except Exception as e:
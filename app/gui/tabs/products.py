@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, cast
 
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -13,16 +13,76 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
-from app.crud import category_crud, product_crud, unit_crud
-from app.gui.qt_helpers import setup_searchable_combo
-from app.gui.tabs.common import BaseCrudTab, list_items_safe, set_combo_by_data
+from app.crud import product_crud, unit_crud
+from app.gui.caches import (
+    get_categories_cached,
+    get_measure_types_cached,
+    get_units_cached,
+)
+from app.gui.qt_helpers import (
+    add_combo_items,
+    fill_combo,
+    set_search_items,
+    setup_searchable_combo,
+)
+from app.gui.table_model import SlotRow
+from app.gui.tabs.common import BaseCrudTab
 from app.models import Product
+from app.service.crud_service import has_items
 from app.service.delete_guards import product_has_no_purchases
 
 
+class ProductRow(SlotRow):
+    """Строка таблицы продуктов."""
+
+    __slots__ = (
+        'id',
+        'name',
+        'category',
+        'measure_type',
+        'unit',
+        'category_id',
+        'unit_id',
+    )
+
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        category: str,
+        measure_type: str,
+        unit: str,
+        category_id: Optional[int],
+        unit_id: Optional[int],
+    ):
+        self.id = id
+        self.name = name
+        self.category = category
+        self.measure_type = measure_type
+        self.unit = unit
+        self.category_id = category_id
+        self.unit_id = unit_id
+
+
+class _ProductRefs(NamedTuple):
+    """Справочники, подготовленные для комбобоксов ProductDialog."""
+
+    cat_labels: List[str]
+    cat_ids: List[int]
+    # itemData -> позиция в комбобоксе (0 — пункт-заглушка)
+    cat_index: Dict[Optional[int], int]
+    unit_labels: List[str]
+    unit_ids: List[int]
+    unit_index: Dict[Optional[int], int]
+
+
 class ProductDialog(QDialog):
     """Диалог создания/редактирования продукта."""
 
+    # (категории, единицы) из кеша и подготовленные по ним данные —
+    # общие для всех экземпляров диалога.
+    _refs_cache: Optional[Tuple[list, list, _ProductRefs]] = None
+
     def __init__(
         self,
         parent=None,
@@ -38,25 +98,23 @@ class ProductDialog(QDialog):
         self.category_combo = QComboBox()
         self.unit_combo = QComboBox()
 
+        # Подсказки ищут по готовым спискам подписей из _ProductRefs,
+        # а не по модели комбобокса (см. _load_refs).
         setup_searchable_combo(
             self.category_combo,
-            placeholder='Начни печатать категорию…'
+            placeholder='Начни печатать категорию…',
+            items=(),
         )
         setup_searchable_combo(
             self.unit_combo,
-            placeholder='Начни печатать единицу…'
+            placeholder='Начни печатать единицу…',
+            items=(),
         )
 
-        self.category_combo.addItem('— без категории —', None)
-        for c in list_items_safe(category_crud, limit=5000):
-            self.category_combo.addItem(c.name, c.id)
-
-        self.unit_combo.addItem('— выбери единицу —', None)
-        for u in list_items_safe(unit_crud, limit=5000):
-            self.unit_combo.addItem(f'{u.measure_type} ({u.unit})', u.id)
+        self._refs: Optional[_ProductRefs] = None
+        self._load_refs()
 
-        set_combo_by_data(self.category_combo, category_id)
-        set_combo_by_data(self.unit_combo, unit_id)
+        self._select(category_id, unit_id)
 
         form = QFormLayout()
         form.addRow('Название:', self.name_edit)
@@ -74,6 +132,85 @@ class ProductDialog(QDialog):
         layout.addWidget(buttons)
         self.setLayout(layout)
 
+    @classmethod
+    def _prepared_refs(cls) -> _ProductRefs:
+        """Подписи, id и индексы справочников; считаются раз на версию."""
+        categories = get_categories_cached()
+        units = get_units_cached()
+        cached = cls._refs_cache
+        if (
+            cached is not None
+            and cached[0] is categories
+            and cached[1] is units
+        ):
+            return cached[2]
+
+        cat_ids = [cat_id for cat_id, _ in categories]
+        unit_ids = [unit_id for unit_id, _ in units]
+        refs = _ProductRefs(
+            cat_labels=[name for _, name in categories],
+            cat_ids=cat_ids,
+            cat_index={
+                None: 0,
+                **{cat_id: i for i, cat_id in enumerate(cat_ids, start=1)},
+            },
+            unit_labels=[label for _, label in units],
+            unit_ids=unit_ids,
+            unit_index={
+                None: 0,
+                **{u_id: i for i, u_id in enumerate(unit_ids, start=1)},
+            },
+        )
+        cls._refs_cache = (categories, units, refs)
+        return refs
+
+    def _load_refs(self) -> None:
+        """Заполняет списки категорий и единиц, если они изменились."""
+        refs = self._prepared_refs()
+        if refs is self._refs:
+            return
+        self._refs = refs
+
+        fill_combo(
+            self.category_combo,
+            '— без категории —',
+            refs.cat_labels,
+            refs.cat_ids,
+        )
+        set_search_items(self.category_combo, refs.cat_labels)
+
+        fill_combo(
+            self.unit_combo,
+            '— выбери единицу —',
+            refs.unit_labels,
+            refs.unit_ids,
+        )
+        set_search_items(self.unit_combo, refs.unit_labels)
+
+    def _select(
+        self,
+        category_id: Optional[int],
+        unit_id: Optional[int],
+    ) -> None:
+        """Выбирает категорию и единицу; неизвестные id — как пустые."""
+        refs = cast(_ProductRefs, self._refs)
+        self.category_combo.setCurrentIndex(
+            refs.cat_index.get(category_id, 0)
+        )
+        self.unit_combo.setCurrentIndex(refs.unit_index.get(unit_id, 0))
+
+    def reset_fields(self) -> None:
+        """Очищает поля для повторного открытия на добавление."""
+        self._load_refs()
+        self.name_edit.clear()
+        self._select(None, None)
+
+    def populate(self, row: ProductRow) -> None:
+        """Заполняет поля значениями строки таблицы."""
+        self._load_refs()
+        self.name_edit.setText(row.name or '')
+        self._select(row.category_id, row.unit_id)
+
     def _on_ok(self) -> None:
         name = self.name_edit.text().strip()
         if not name:
@@ -134,42 +271,40 @@ class ProductsTab(BaseCrudTab):
     list_limit = 5000
     delete_guards = [product_has_no_purchases]
 
-    enable_text_filter = True
-    filter_placeholder = 'Фильтр по продуктам (название/категория/ед.)…'
-
-    def get_order_by(self):
-        return Product.name
-
     def pre_add_check(self) -> Optional[str]:
-        if not list_items_safe(unit_crud, limit=1):
+        if not has_items(unit_crud):
             return 'Сначала создай хотя бы одну единицу измерения.'
         return None
 
-    def items_to_rows(self, items: List[Any]) -> List[Dict[str, Any]]:
-        rows: List[Dict[str, Any]] = []
-        for p in cast(List[Product], items):
-            rows.append(
-                {
-                    'id': p.id,
-                    'name': p.name,
-                    'category': p.category.name if p.category else '—',
-                    'measure_type': p.unit.measure_type if p.unit else '—',
-                    'unit': p.unit.unit if p.unit else '—',
-                    'category_id': p.category_id,
-                    'unit_id': p.unit_id,
-                }
+    def items_to_rows(  # type: ignore[override]
+        self,
+        items: List[Any],
+    ) -> List[ProductRow]:
+        return [
+            ProductRow(
+                p.id,
+                p.name,
+                cat.name if (cat := p.category) else '—',
+                u.measure_type if (u := p.unit) else '—',
+                u.unit if u else '—',
+                p.category_id,
+                p.unit_id,
             )
-        return rows
+            for p in items
+        ]
 
     def make_add_dialog(self) -> QDialog:
         return ProductDialog(self)
 
-    def make_edit_dialog(self, row: Dict[str, Any]) -> QDialog:
+    def make_edit_dialog(  # type: ignore[override]
+        self,
+        row: ProductRow,
+    ) -> QDialog:
         return ProductDialog(
             self,
-            name=str(row.get('name') or ''),
-            category_id=cast(Optional[int], row.get('category_id')),
-            unit_id=cast(Optional[int], row.get('unit_id')),
+            name=row.name or '',
+            category_id=row.category_id,
+            unit_id=row.unit_id,
         )
 
     def build_create_obj(self, dlg: QDialog) -> Any:
@@ -189,24 +324,24 @@ class ProductsTab(BaseCrudTab):
     def _build_filter_bar(self, layout) -> None:
         super()._build_filter_bar(layout)
 
+        names = [name for _, name in get_categories_cached()]
         self.filter_category_combo = QComboBox()
         setup_searchable_combo(
-            self.filter_category_combo, placeholder='Категория…'
+            self.filter_category_combo,
+            placeholder='Категория…',
+            items=names,
         )
         self.filter_category_combo.addItem('— все категории —', None)
-        for c in list_items_safe(category_crud, limit=5000):
-            self.filter_category_combo.addItem(c.name, c.name)
+        add_combo_items(self.filter_category_combo, names, names)
 
         self.filter_measure_type_combo = QComboBox()
         self.filter_measure_type_combo.addItem('— все типы —', None)
 
-        units = list_items_safe(unit_crud, limit=5000)
-        measure_types = sorted(
-            {u.measure_type for u in units if u.measure_type}
-        )
+        measure_types = get_measure_types_cached()
 
-        for mt in measure_types:
-            self.filter_measure_type_combo.addItem(mt, mt)
+        add_combo_items(
+            self.filter_measure_type_combo, measure_types, measure_types
+        )
 
         layout.addSpacing(10)
         layout.addWidget(QLabel('Категория:'))
@@ -225,4 +360,3 @@ class ProductsTab(BaseCrudTab):
     def reset_extra_filters(self) -> None:
         self.filter_category_combo.setCurrentIndex(0)
         self.filter_measure_type_combo.setCurrentIndex(0)
-        self.filter_unit_combo.setCurrentIndex(0)
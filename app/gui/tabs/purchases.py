@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import time
 from datetime import date
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, cast
 
-from PyQt6.QtCore import QDate
+from PyQt6.QtCore import QDate, QSignalBlocker, QTimer
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -13,7 +15,6 @@ from PyQt6.QtWidgets import (
     QDoubleSpinBox,
     QFormLayout,
     QHBoxLayout,
-    QHeaderView,
     QLabel,
     QMessageBox,
     QPushButton,
@@ -23,20 +24,163 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from app.crud import product_crud, store_crud
-from app.gui.qt_helpers import setup_searchable_combo
-from app.gui.table_model import DictTableModel
-from app.gui.tabs.common import list_items_safe, set_combo_by_data
+from app.crud import get_version, product_crud, store_crud
+from app.gui.caches import get_products_cached, get_stores_cached
+from app.gui.qt_helpers import (
+    fill_combo,
+    setup_fixed_columns,
+    setup_searchable_combo,
+)
+from app.gui.table_model import DictTableModel, SlotRow
+from app.gui.tabs.common import (
+    build_crud_row,
+    set_combo_by_data,
+    setup_crud_table,
+)
 from app.models import Purchase
+from app.service.crud_service import has_items
 from app.service.purchases import (
+    count_purchases_filtered,
     create_purchase,
     delete_purchase,
-    get_purchase_by_product,
-    get_purchase_by_store,
-    list_purchases,
+    list_purchases_filtered,
     update_purchase,
 )
 
+# Таблицы, из которых собраны строки вкладки покупок.
+_RELOAD_DEPS = ('purchase', 'product', 'store', 'category', 'unit')
+
+# От каких таблиц зависит каждый список в ленте фильтров.
+_FILTER_DEPS = {
+    'products': ('product', 'unit'),
+    'stores': ('store',),
+}
+
+
+class PurchaseRow(SlotRow):
+    """Строка таблицы покупок."""
+
+    __slots__ = (
+        # Скалярные поля покупки, в порядке _get_plain.
+        'id',
+        'purchase_date',
+        'product_id',
+        'store_id',
+        'is_promo',
+        'promo_type',
+        'comment',
+        # Имена из связей и числа, приведённые к float.
+        'product',
+        'category',
+        'unit',
+        'store',
+        'quantity',
+        'total_price',
+        'unit_price',
+        'regular_unit_price',
+    )
+
+    def __init__(
+        self,
+        id: int,
+        purchase_date: date,
+        product_id: int,
+        store_id: int,
+        is_promo: bool,
+        promo_type: Optional[str],
+        comment: Optional[str],
+        product: Optional[str],
+        category: Optional[str],
+        unit: Optional[str],
+        store: Optional[str],
+        quantity: Optional[float],
+        total_price: Optional[float],
+        unit_price: float,
+        regular_unit_price: Optional[float],
+    ):
+        self.id = id
+        self.purchase_date = purchase_date
+        self.product_id = product_id
+        self.store_id = store_id
+        self.is_promo = is_promo
+        self.promo_type = promo_type
+        self.comment = comment
+        self.product = product
+        self.category = category
+        self.unit = unit
+        self.store = store
+        self.quantity = quantity
+        self.total_price = total_price
+        self.unit_price = unit_price
+        self.regular_unit_price = regular_unit_price
+
+
+# Скалярные поля покупки, которые кладутся в строку как есть.
+_get_plain = attrgetter(*PurchaseRow.__slots__[:7])
+
+
+def _to_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def purchases_to_rows(items: List[Purchase]) -> List[PurchaseRow]:
+    """Собирает строки таблицы покупок без вызова ``to_dict()``.
+
+    Скалярные поля достаются одним вызовом ``attrgetter``, а из связей
+    берутся только имена, которые показывает вкладка.
+
+    Args:
+        items (List[Purchase]): Покупки с загруженными связями.
+
+    Returns:
+        List[PurchaseRow]: Строки для ``DictTableModel``.
+    """
+    rows: List[PurchaseRow] = []
+    append = rows.append
+    for p in items:
+        product = p.product
+        if product is not None:
+            category = product.category
+            unit = product.unit
+            names = (
+                product.name,
+                category.name if category else None,
+                unit.unit if unit else None,
+            )
+        else:
+            names = (None, None, None)
+        store = p.store
+        append(PurchaseRow(
+            *_get_plain(p),
+            *names,
+            store.name if store else None,
+            _to_float(p.quantity),
+            _to_float(p.total_price),
+            float(p.unit_price),
+            _to_float(p.regular_unit_price),
+        ))
+    return rows
+
+
+def _filter_versions(key: str) -> tuple:
+    return tuple(get_version(t) for t in _FILTER_DEPS[key])
+
+
+def _refill_keeping_choice(
+    combo: QComboBox,
+    placeholder: str,
+    labels: List[str],
+    data: List[Any],
+) -> None:
+    """Перезаполняет фильтр, сохраняя выбранный элемент, если он есть."""
+    current = combo.currentData()
+    blocker = QSignalBlocker(combo)
+    try:
+        fill_combo(combo, placeholder, labels, data)
+        set_combo_by_data(combo, current)
+    finally:
+        blocker.unblock()
+
 
 class PurchaseDialog(QDialog):
     """Диалог создания/редактирования покупки."""
@@ -58,9 +202,6 @@ class PurchaseDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle('Покупка')
 
-        products = list_items_safe(product_crud, limit=5000)
-        stores = list_items_safe(store_crud, limit=5000)
-
         self.product_combo = QComboBox()
         self.store_combo = QComboBox()
 
@@ -73,70 +214,59 @@ class PurchaseDialog(QDialog):
             placeholder='Начни печатать магазин…'
         )
 
-        self.product_combo.addItem('— выбери продукт —', None)
-        for p in products:
-            label = (
-                f'{p.name} ({p.unit.measure_type} '
-                f'{p.unit.unit}) (id={p.id})'
-            )
-            self.product_combo.addItem(label, p.id)
-
-        self.store_combo.addItem('— выбери магазин —', None)
-        for s in stores:
-            self.store_combo.addItem(f'{s.name} (id={s.id})', s.id)
+        # Списки из кеша, по которым заполнены комбобоксы (см. _load_refs).
+        self._refs: Optional[tuple] = None
+        self._load_refs()
 
         self.date_edit = QDateEdit()
         self.date_edit.setCalendarPopup(True)
-        d = purchase_date or date.today()
-        self.date_edit.setDate(QDate(d.year, d.month, d.day))
 
         self.quantity_spin = QDoubleSpinBox()
         self.quantity_spin.setDecimals(3)
         self.quantity_spin.setRange(0.001, 1_000_000)
-        self.quantity_spin.setValue(float(quantity) if quantity else 1.0)
 
         self.price_spin = QDoubleSpinBox()
         self.price_spin.setDecimals(2)
         self.price_spin.setRange(0.01, 1_000_000_000)
-        self.price_spin.setValue(float(total_price) if total_price else 0.01)
 
         self.unit_price_label = QLabel('Цена за единицу: —')
         self.quantity_spin.valueChanged.connect(self._update_unit_price)
         self.price_spin.valueChanged.connect(self._update_unit_price)
-        self._update_unit_price()
 
         self.is_promo_check = QCheckBox('Акция')
-        self.is_promo_check.setChecked(bool(is_promo))
         self.is_promo_check.stateChanged.connect(self._toggle_promo_fields)
 
         self.promo_type_combo = QComboBox()
-        self.promo_type_combo.addItem('— тип акции —', None)
-        for t in [
+        promo_types = [
             'discount',
             'multi_buy',
             'loyalty',
             'clearance',
             'coupon',
             'cashback',
-        ]:
-            self.promo_type_combo.addItem(t, t)
+        ]
+        fill_combo(
+            self.promo_type_combo, '— тип акции —', promo_types, promo_types
+        )
 
         self.regular_price_spin = QDoubleSpinBox()
         self.regular_price_spin.setDecimals(2)
         self.regular_price_spin.setRange(0.01, 1_000_000_000)
-        self.regular_price_spin.setValue(
-            float(regular_unit_price) if regular_unit_price else 0.01
-        )
 
         self.comment_edit = QTextEdit()
         self.comment_edit.setFixedHeight(80)
-        self.comment_edit.setPlainText(comment or '')
 
-        set_combo_by_data(self.product_combo, product_id)
-        set_combo_by_data(self.store_combo, store_id)
-        set_combo_by_data(self.promo_type_combo, promo_type)
-
-        self._toggle_promo_fields()
+        self._set_fields(
+            purchase_date=purchase_date,
+            product_id=product_id,
+            store_id=store_id,
+            quantity=quantity,
+            total_price=total_price,
+            comment=comment,
+            is_promo=is_promo,
+            promo_type=promo_type,
+            regular_unit_price=regular_unit_price,
+        )
 
         form = QFormLayout()
         form.addRow('Дата:', self.date_edit)
@@ -161,6 +291,84 @@ class PurchaseDialog(QDialog):
         layout.addWidget(buttons)
         self.setLayout(layout)
 
+    def _load_refs(self) -> None:
+        """Заполняет списки продуктов и магазинов, если они изменились."""
+        products = get_products_cached()
+        stores = get_stores_cached()
+        refs = self._refs
+        if refs is not None and refs[0] is products and refs[1] is stores:
+            return
+        self._refs = (products, stores)
+
+        fill_combo(
+            self.product_combo,
+            '— выбери продукт —',
+            [
+                f'{name} ({measure_type} {unit}) (id={p_id})'
+                for p_id, name, measure_type, unit in products
+            ],
+            [p_id for p_id, _, _, _ in products],
+        )
+
+        fill_combo(
+            self.store_combo,
+            '— выбери магазин —',
+            [f'{name} (id={s_id})' for s_id, name in stores],
+            [s_id for s_id, _ in stores],
+        )
+
+    def _set_fields(
+        self,
+        *,
+        purchase_date: Optional[date] = None,
+        product_id: Optional[int] = None,
+        store_id: Optional[int] = None,
+        quantity: Optional[float] = None,
+        total_price: Optional[float] = None,
+        comment: Optional[str] = None,
+        is_promo: bool = False,
+        promo_type: Optional[str] = None,
+        regular_unit_price: Optional[float] = None,
+    ) -> None:
+        d = purchase_date or date.today()
+        self.date_edit.setDate(QDate(d.year, d.month, d.day))
+
+        self.quantity_spin.setValue(float(quantity) if quantity else 1.0)
+        self.price_spin.setValue(float(total_price) if total_price else 0.01)
+        self._update_unit_price()
+
+        self.is_promo_check.setChecked(bool(is_promo))
+        self.regular_price_spin.setValue(
+            float(regular_unit_price) if regular_unit_price else 0.01
+        )
+        self.comment_edit.setPlainText(comment or '')
+
+        set_combo_by_data(self.product_combo, product_id)
+        set_combo_by_data(self.store_combo, store_id)
+        set_combo_by_data(self.promo_type_combo, promo_type)
+
+        self._toggle_promo_fields()
+
+    def reset_fields(self) -> None:
+        """Очищает поля для повторного открытия на добавление."""
+        self._load_refs()
+        self._set_fields()
+
+    def populate(self, row: PurchaseRow) -> None:
+        """Заполняет поля значениями строки таблицы."""
+        self._load_refs()
+        self._set_fields(
+            purchase_date=row.purchase_date,
+            product_id=row.product_id,
+            store_id=row.store_id,
+            quantity=row.quantity,
+            total_price=row.total_price,
+            comment=row.comment,
+            is_promo=bool(row.is_promo),
+            promo_type=row.promo_type,
+            regular_unit_price=row.regular_unit_price,
+        )
+
     def _update_unit_price(self) -> None:
         q = self.quantity_spin.value()
         p = self.price_spin.value()
@@ -210,45 +418,81 @@ class PurchaseDialog(QDialog):
 class PurchasesTab(QWidget):
     """CRUD-вкладка для покупок с фильтрами."""
 
+    columns = [
+        ('purchase_date', 'Дата'),
+        ('product', 'Продукт'),
+        ('category', 'Категория'),
+        ('store', 'Магазин'),
+        ('quantity', 'Кол-во'),
+        ('total_price', 'Сумма'),
+        ('unit_price', 'Цена/ед.'),
+        ('unit', 'Ед.'),
+        ('is_promo', 'Акция'),
+        ('comment', 'Комментарий'),
+    ]
+    column_widths = {
+        'purchase_date': 95,
+        'product': 280,
+        'category': 180,
+        'store': 180,
+        'quantity': 90,
+        'total_price': 90,
+        'unit_price': 90,
+        'unit': 60,
+        'is_promo': 70,
+    }
+    stretch_column = 'comment'
+
+    list_limit: int = 5000
+    # Строки подгружаются страницами по мере прокрутки (не больше
+    # list_limit всего).
+    page_size: int = 100
+    # Сколько секунд повторный reload с теми же фильтрами и без
+    # изменений в таблицах не ходит в БД. Ограничение нужно для
+    # изменений в обход приложения (CLI, другой процесс).
+    reload_ttl: float = 30.0
+    # Пауза, за которую серия reload (клики «Применить», сброс, правки)
+    # схлопывается в один запрос к БД.
+    reload_debounce_ms: int = 80
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Фильтры и сортировка последнего reload: по ним читаются
+        # следующие страницы.
+        self._page_query: Dict[str, Any] = {}
+        self._total = 0
+        # (фильтры, версии таблиц) последнего reload и когда он был.
+        self._loaded_key: Optional[tuple] = None
+        self._loaded_at = 0.0
+        # Версии таблиц, по которым построены списки фильтров.
+        self._filter_versions: Dict[str, tuple] = {}
+        # Диалог добавления/редактирования, см. _reuse_dialog.
+        self._dialog: Optional[PurchaseDialog] = None
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(self.reload_debounce_ms)
+        self._reload_timer.timeout.connect(self._do_reload)
+
         self.table = QTableView()
         self.model = DictTableModel(
-            columns=[
-                ('purchase_date', 'Дата'),
-                ('product', 'Продукт'),
-                ('category', 'Категория'),
-                ('store', 'Магазин'),
-                ('quantity', 'Кол-во'),
-                ('total_price', 'Сумма'),
-                ('unit_price', 'Цена/ед.'),
-                ('unit', 'Ед.'),
-                ('is_promo', 'Акция'),
-                ('comment', 'Комментарий'),
-            ],
+            columns=self.columns,
             rows=[],
+            formatters={
+                'purchase_date': date.isoformat,
+                'total_price': '{:.2f}'.format,
+                'unit_price': '{:.2f}'.format,
+            },
         )
         self.table.setModel(self.model)
-        self.table.setSelectionBehavior(
-            QTableView.SelectionBehavior.SelectRows
-        )
-        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        setup_crud_table(self.table)
         self._apply_table_layout()
+        self.table.verticalScrollBar().valueChanged.connect(
+            self._on_table_scrolled
+        )
 
-        btn_add = QPushButton('Добавить')
-        btn_edit = QPushButton('Редактировать')
-        btn_del = QPushButton('Удалить')
-
-        btn_add.clicked.connect(self.on_add)
-        btn_edit.clicked.connect(self.on_edit)
-        btn_del.clicked.connect(self.on_delete)
-
-        crud_row = QHBoxLayout()
-        crud_row.addWidget(btn_add)
-        crud_row.addWidget(btn_edit)
-        crud_row.addWidget(btn_del)
-        crud_row.addStretch(1)
+        crud_row = build_crud_row(self)
 
         self.filter_product_combo = QComboBox()
         self.filter_store_combo = QComboBox()
@@ -316,7 +560,7 @@ class PurchasesTab(QWidget):
         self.setLayout(layout)
 
         self._load_filter_data()
-        self.reload()
+        self._do_reload()
 
     def _apply_table_layout(self) -> None:
         """Настраивает ширины колонок таблицы покупок.
@@ -327,20 +571,12 @@ class PurchasesTab(QWidget):
         - режим Interactive оставляет пользователю возможность руками
           менять ширины
         """
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-
-        self.table.setColumnWidth(0, 95)
-        self.table.setColumnWidth(1, 280)
-        self.table.setColumnWidth(2, 180)
-        self.table.setColumnWidth(3, 180)
-        self.table.setColumnWidth(4, 90)
-        self.table.setColumnWidth(5, 90)
-        self.table.setColumnWidth(6, 90)
-        self.table.setColumnWidth(7, 60)
-        self.table.setColumnWidth(8, 70)
-
-        header.setSectionResizeMode(9, QHeaderView.ResizeMode.Stretch)
+        setup_fixed_columns(
+            self.table,
+            [key for key, _ in self.columns],
+            self.column_widths,
+            stretch_key=self.stretch_column,
+        )
 
     def _toggle_date_filters(self) -> None:
         enabled = self.filter_date_check.isChecked()
@@ -348,21 +584,66 @@ class PurchasesTab(QWidget):
         self.filter_to.setEnabled(enabled)
 
     def _load_filter_data(self) -> None:
-        self.filter_product_combo.clear()
-        self.filter_product_combo.addItem('— все продукты —', None)
-        for p in list_items_safe(product_crud, limit=5000):
-            self.filter_product_combo.addItem(p.name, p.id)
+        self._load_filter_products()
+        self._load_filter_stores()
+
+    def _load_filter_products(self) -> None:
+        self._filter_versions['products'] = _filter_versions('products')
+        products = get_products_cached()
+        _refill_keeping_choice(
+            self.filter_product_combo,
+            '— все продукты —',
+            [name for _, name, _, _ in products],
+            [p_id for p_id, _, _, _ in products],
+        )
+
+    def _load_filter_stores(self) -> None:
+        self._filter_versions['stores'] = _filter_versions('stores')
+        stores = get_stores_cached()
+        _refill_keeping_choice(
+            self.filter_store_combo,
+            '— все магазины —',
+            [name for _, name in stores],
+            [s_id for s_id, _ in stores],
+        )
 
-        self.filter_store_combo.clear()
-        self.filter_store_combo.addItem('— все магазины —', None)
-        for s in list_items_safe(store_crud, limit=5000):
-            self.filter_store_combo.addItem(s.name, s.id)
+    def showEvent(self, event) -> None:  # noqa: ANN001
+        """Обновляет списки фильтров, если их таблицы менялись.
 
-    def _selected_row(self) -> Optional[Dict[str, Any]]:
+        Переключение вкладок стоит только сравнения счётчиков версий;
+        списки перестраиваются, лишь когда продукты или магазины
+        правили в другой вкладке.
+        """
+        super().showEvent(event)
+        versions = self._filter_versions
+        if versions.get('products') != _filter_versions('products'):
+            self._load_filter_products()
+        if versions.get('stores') != _filter_versions('stores'):
+            self._load_filter_stores()
+
+    def _reuse_dialog(
+        self,
+        row: Optional[PurchaseRow],
+    ) -> PurchaseDialog:
+        """Возвращает диалог покупки для добавления (row=None) или правки.
+
+        Диалог создаётся один раз на вкладку, вместе с календарём у поля
+        даты, и при следующих открытиях только перезаполняется.
+        """
+        dlg = self._dialog
+        if dlg is None:
+            dlg = self._dialog = PurchaseDialog(self)
+        if row is None:
+            dlg.reset_fields()
+        else:
+            dlg.populate(row)
+        return dlg
+
+    def _selected_row(self) -> Optional[PurchaseRow]:
         idx = self.table.currentIndex()
         if not idx.isValid():
             return None
-        return cast(Dict[str, Any], self.model.row_dict(idx.row()))
+        return cast(PurchaseRow, self.model.row_dict(idx.row()))
 
     def _current_filters(self) -> Dict[str, Any]:
         product_id = self.filter_product_combo.currentData()
@@ -384,72 +665,119 @@ class PurchasesTab(QWidget):
         }
 
     def on_reset_filters(self) -> None:
-        set_combo_by_data(self.filter_product_combo, None)
-        set_combo_by_data(self.filter_store_combo, None)
+        # Сигналы виджетов ленты молчат, пока она сбрасывается целиком:
+        # зависимые обработчики и reload отрабатывают один раз в конце.
+        blockers = [
+            QSignalBlocker(w)
+            for w in (
+                self.filter_product_combo,
+                self.filter_store_combo,
+                self.filter_date_check,
+                self.filter_from,
+                self.filter_to,
+            )
+        ]
+        try:
+            set_combo_by_data(self.filter_product_combo, None)
+            set_combo_by_data(self.filter_store_combo, None)
 
-        self.filter_date_check.setChecked(False)
+            self.filter_date_check.setChecked(False)
 
-        today = date.today()
-        self.filter_from.setDate(QDate(today.year, today.month, 1))
-        self.filter_to.setDate(QDate(today.year, today.month, today.day))
+            today = date.today()
+            self.filter_from.setDate(QDate(today.year, today.month, 1))
+            self.filter_to.setDate(QDate(today.year, today.month, today.day))
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
 
+        self._toggle_date_filters()
         self.reload()
 
     def reload(self) -> None:
-        f = self._current_filters()
-        sort_desc = f['sort_dir'] == 'desc'
+        """Планирует перечитывание таблицы.
 
-        items: List[Purchase]
+        Повторный вызов до срабатывания таймера откладывает его, так что
+        серия запросов выполняется один раз.
+        """
+        self._reload_timer.start()
 
-        if f['product_id'] is not None:
-            items = get_purchase_by_product(
-                product_id=f['product_id'],
-                from_date=f['from_date'],
-                to_date=f['to_date'],
-            )
-            if f['store_id'] is not None:
-                items = [p for p in items if p.store_id == f['store_id']]
+    def _do_reload(self) -> None:
+        """Читает первую страницу покупок под текущими фильтрами."""
+        self._reload_timer.stop()
+        f = self._current_filters()
+        # Фильтры, сортировка и лимит — в SQL-запросе.
+        order_by = (
+            Purchase.purchase_date.desc()
+            if f['sort_dir'] == 'desc'
+            else Purchase.purchase_date.asc()
+        )
+        filters = {
+            'product_id': f['product_id'],
+            'store_id': f['store_id'],
+            'from_date': f['from_date'],
+            'to_date': f['to_date'],
+        }
+        # Те же фильтры и ни одна таблица не менялась — в модели уже
+        # ровно эти строки.
+        key = (
+            tuple(f.values()),
+            tuple(get_version(t) for t in _RELOAD_DEPS),
+        )
+        now = time.monotonic()
+        if (
+            key == self._loaded_key
+            and now - self._loaded_at < self.reload_ttl
+        ):
+            return
+
+        try:
+            total = count_purchases_filtered(**filters)
+        except ValueError as e:
+            QMessageBox.warning(self, 'Проверка', str(e))
+            return
 
-        elif f['store_id'] is not None:
-            items = get_purchase_by_store(store_id=f['store_id'])
+        self._page_query = {**filters, 'order_by': order_by}
+        self._total = min(total, self.list_limit)
+        self.model.set_rows(self._fetch_page(offset=0))
+        self._update_count_label()
+        self._loaded_key = key
+        self._loaded_at = now
+
+    def _fetch_page(self, *, offset: int) -> List[PurchaseRow]:
+        limit = min(self.page_size, self._total - offset)
+        if limit <= 0:
+            return []
+        items = list_purchases_filtered(
+            **self._page_query, offset=offset, limit=limit
+        )
+        return purchases_to_rows(items)
 
-            if f['from_date'] is not None:
-                items = [p for p in items if p.purchase_date >= f['from_date']]
-            if f['to_date'] is not None:
-                items = [p for p in items if p.purchase_date <= f['to_date']]
+    def _has_more(self) -> bool:
+        return self.model.rowCount() < self._total
 
-        else:
-            order_by = (
-                Purchase.purchase_date.desc()
-                if sort_desc
-                else Purchase.purchase_date.asc()
+    def _on_table_scrolled(self, value: int) -> None:
+        """Подгружает страницу, когда до конца таблицы меньше экрана."""
+        bar = self.table.verticalScrollBar()
+        if self._has_more() and value >= bar.maximum() - bar.pageStep():
+            self.model.append_rows(
+                self._fetch_page(offset=self.model.rowCount())
             )
-            items = list_purchases(limit=5000, order_by=order_by)
-
-            if f['from_date'] is not None:
-                items = [p for p in items if p.purchase_date >= f['from_date']]
-            if f['to_date'] is not None:
-                items = [p for p in items if p.purchase_date <= f['to_date']]
+            self._update_count_label()
 
-        items = sorted(
-            items,
-            key=lambda p: cast(date, p.purchase_date),
-            reverse=sort_desc,
+    def _update_count_label(self) -> None:
+        self.count_label.setText(
+            f'Показано покупок: {self.model.rowCount()} из {self._total}'
         )
 
-        rows = [p.to_dict() for p in items]
-        self.model.set_rows(rows)
-        self.count_label.setText(f'Показано покупок: {len(rows)}')
-
     def on_add(self) -> None:
-        if not list_items_safe(product_crud, limit=1):
+        if not has_items(product_crud):
             QMessageBox.warning(
                 self,
                 'Нельзя',
                 'Сначала создай хотя бы один продукт.'
             )
             return
-        if not list_items_safe(store_crud, limit=1):
+        if not has_items(store_crud):
             QMessageBox.warning(
                 self,
                 'Нельзя',
@@ -457,7 +785,7 @@ class PurchasesTab(QWidget):
             )
             return
 
-        dlg = PurchaseDialog(self)
+        dlg = self._reuse_dialog(None)
         if dlg.exec() != QDialog.DialogCode.Accepted:
             return
 
@@ -484,28 +812,14 @@ class PurchasesTab(QWidget):
             QMessageBox.information(self, 'Ок', 'Выбери покупку в таблице.')
             return
 
-        dlg = PurchaseDialog(
-            self,
-            purchase_date=cast(Optional[date], row.get('purchase_date')),
-            product_id=cast(Optional[int], row.get('product_id')),
-            store_id=cast(Optional[int], row.get('store_id')),
-            quantity=cast(Optional[float], row.get('quantity')),
-            total_price=cast(Optional[float], row.get('total_price')),
-            comment=cast(Optional[str], row.get('comment')),
-            is_promo=bool(row.get('is_promo')),
-            promo_type=cast(Optional[str], row.get('promo_type')),
-            regular_unit_price=cast(
-                Optional[float],
-                row.get('regular_unit_price')
-            ),
-        )
+        dlg = self._reuse_dialog(row)
         if dlg.exec() != QDialog.DialogCode.Accepted:
             return
 
         v = dlg.values()
         try:
             update_purchase(
-                purchase_id=int(row['id']),
+                purchase_id=int(row.id),
                 store_id=v['store_id'],
                 product_id=v['product_id'],
                 total_price=v['total_price'],
@@ -527,19 +841,19 @@ class PurchasesTab(QWidget):
             return
 
         label = (
-            f'{row.get("purchase_date")} —'
-            f'{row.get("product")} — {row.get("store")}'
+            f'{row.purchase_date} —'
+            f'{row.product} — {row.store}'
         )
         ok = QMessageBox.question(
             self,
             'Подтверждение',
-            f'Удалить покупку: {label} (id={row["id"]})?',
+            f'Удалить покупку: {label} (id={row.id})?',
         )
         if ok != QMessageBox.StandardButton.Yes:
             return
 
         try:
-            delete_purchase(int(row['id']))
+            delete_purchase(int(row.id))
             self.reload()
         except Exception as e:
             QMessageBox.critical(self, 'Ошибка', str(e))
@@ -13,6 +13,10 @@ from app.core.constants import DEFAULT_MAXLEN, UNHANDLED
 
 F = TypeVar('F', bound=Callable[..., Any])
 
+# Сколько элементов последовательности и ключей словаря попадает в лог.
+_SEQ_LIMIT = 6
+_MAP_LIMIT = 6
+
 
 def _truncate(
     text: str,
@@ -20,19 +24,23 @@ def _truncate(
 ) -> str:
     if len(text) <= maxlen:
         return text
-    cut = max(0, maxlen-3)
-    return text[:cut] + '...'
+    # maxlen < 3 — места хватает только на многоточие.
+    return text[:maxlen - 3] + '...' if maxlen >= 3 else '...'
+
+
+# Ответ _is_model зависит только от класса: {класс: модель ли}.
+_MODEL_CLASSES: dict[type, bool] = {}
 
 
 def _is_model(
     obj: Any
 ) -> bool:
-    mod = getattr(getattr(obj, '__class__', None), '__module__', '')
-    return bool(mod) and mod.startswith('app.models')
-
-
-def _repr_none(value: Any) -> str | object:
-    return 'None' if value is None else UNHANDLED
+    cls = type(obj)
+    res = _MODEL_CLASSES.get(cls)
+    if res is None:
+        mod = getattr(cls, '__module__', '') or ''
+        res = _MODEL_CLASSES[cls] = mod.startswith('app.models')
+    return res
 
 
 def _repr_scalar(value: Any, *, maxlen: int) -> str | object:
@@ -133,59 +141,114 @@ def _safe_repr(
     value: Any,
     *,
     maxlen: int = DEFAULT_MAXLEN,
-    seq_limit: int = 6,
-    map_limit: int = 6,
+    seq_limit: int = _SEQ_LIMIT,
+    map_limit: int = _MAP_LIMIT,
 ) -> str:
-    # Роутер: пробуем обработчики по очереди, первый “поймал” — вернул строку.
-    for handler in (
-        lambda v: _repr_none(v),
-        lambda v: _repr_scalar(v, maxlen=maxlen),
-        lambda v: _repr_namespace(
-            v,
+    # Частые встроенные типы — сразу по точному типу, одним поиском в dict.
+    handler = _EXACT_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value, maxlen, seq_limit, map_limit)
+
+    # Подклассы и прочие объекты: обработчики по очереди, первый
+    # “поймал” — вернул строку.
+    res = _repr_scalar(value, maxlen=maxlen)
+    if res is UNHANDLED:
+        res = _repr_namespace(
+            value,
             maxlen=maxlen,
             seq_limit=seq_limit,
-            map_limit=map_limit
-        ),
-        lambda v: _repr_model(v),
-        lambda v: _repr_mapping(
-            v,
+            map_limit=map_limit,
+        )
+    if res is UNHANDLED:
+        res = _repr_model(value)
+    if res is UNHANDLED:
+        res = _repr_mapping(
+            value,
             maxlen=maxlen,
             s_lim=seq_limit,
-            m_lim=map_limit
-        ),
-        lambda v: _repr_sequence(
-            v,
+            m_lim=map_limit,
+        )
+    if res is UNHANDLED:
+        res = _repr_sequence(
+            value,
             maxlen=maxlen,
             seq_limit=seq_limit,
-            map_limit=map_limit
-        ),
-    ):
-        res = handler(value)
-        if res is not UNHANDLED:
-            return res  # type: ignore[return-value]
-
-    return _repr_fallback(value, maxlen=maxlen)
-
-
-def _is_empty_value(val: Any) -> bool:
-    return (
-        val is None
-        or (isinstance(val, str) and val == '')
-        or (isinstance(
-            val,
-            (
-                list,
-                tuple,
-                set,
-                frozenset,
-                dict
-            )
-        ) and len(val) == 0)
+            map_limit=map_limit,
+        )
+    if res is UNHANDLED:
+        return _repr_fallback(value, maxlen=maxlen)
+    return res  # type: ignore[return-value]
+
+
+def _exact_none(value: Any, maxlen: int, s_lim: int, m_lim: int) -> str:
+    return 'None'
+
+
+def _exact_number(value: Any, maxlen: int, s_lim: int, m_lim: int) -> str:
+    return repr(value)
+
+
+def _exact_str(value: Any, maxlen: int, s_lim: int, m_lim: int) -> str:
+    return _truncate(repr(value), maxlen)
+
+
+def _exact_date(value: Any, maxlen: int, s_lim: int, m_lim: int) -> str:
+    return value.isoformat()
+
+
+def _exact_mapping(value: Any, maxlen: int, s_lim: int, m_lim: int) -> str:
+    return _repr_mapping(  # type: ignore[return-value]
+        value, maxlen=maxlen, s_lim=s_lim, m_lim=m_lim
+    )
+
+
+def _exact_sequence(
+    value: Any,
+    maxlen: int,
+    s_lim: int,
+    m_lim: int,
+) -> str:
+    return _repr_sequence(  # type: ignore[return-value]
+        value, maxlen=maxlen, seq_limit=s_lim, map_limit=m_lim
     )
 
 
+# Обработчики по точному типу значения. Подклассы (IntEnum, OrderedDict
+# и т.п.) сюда не попадают и идут по цепочке в _safe_repr.
+_EXACT_HANDLERS: dict[type, Callable[[Any, int, int, int], str]] = {
+    type(None): _exact_none,
+    int: _exact_number,
+    float: _exact_number,
+    bool: _exact_number,
+    str: _exact_str,
+    date: _exact_date,
+    datetime: _exact_date,
+    dict: _exact_mapping,
+    list: _exact_sequence,
+    tuple: _exact_sequence,
+    set: _exact_sequence,
+    frozenset: _exact_sequence,
+}
+
+
+# Значения этих типов считаются пустыми при нулевой длине (skip_empty).
+# Точный тип проверяется через frozenset и not, подклассы — по длине.
+_SIZED = (str, list, tuple, set, frozenset, dict)
+_SIZED_EXACT = frozenset(_SIZED)
+
+# Параметры, которые не попадают в лог вызова.
+_SKIP_PARAMS = frozenset(('self', 'cls'))
+
+
+def _signature(func: Callable[..., Any]) -> Optional[inspect.Signature]:
+    try:
+        return inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
+
+
 def _format_call(
-    func: Callable[..., Any],
+    sig: Optional[inspect.Signature],
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
     *,
@@ -194,29 +257,73 @@ def _format_call(
     skip_none: bool,
     skip_empty: bool,
 ) -> str:
+    if sig is None:
+        return _safe_repr(kwargs, maxlen=maxlen) if kwargs else ''
     try:
-        sig = inspect.signature(func)
         bound = sig.bind_partial(*args, **kwargs)
 
         if include_defaults:
             bound.apply_defaults()
 
+        # Проверки пустоты и repr частых типов — прямо в цикле, без
+        # вызова функции на каждый аргумент.
+        exact_handlers = _EXACT_HANDLERS
+        sized_exact = _SIZED_EXACT
         parts: list[str] = []
         for key, value in bound.arguments.items():
-            if key in {'self', 'cls'}:
-                continue
-            if skip_none and value is None:
-                continue
-
-            if skip_empty and _is_empty_value(value):
+            if key in _SKIP_PARAMS:
                 continue
-            parts.append(f'{key}={_safe_repr(value, maxlen=maxlen)}')
+            if value is None:
+                if skip_none or skip_empty:
+                    continue
+            elif skip_empty:
+                cls = type(value)
+                if cls in sized_exact:
+                    if not value:
+                        continue
+                elif isinstance(value, _SIZED) and len(value) == 0:
+                    continue
+
+            handler = exact_handlers.get(type(value))
+            text = (
+                handler(value, maxlen, _SEQ_LIMIT, _MAP_LIMIT)
+                if handler is not None
+                else _safe_repr(value, maxlen=maxlen)
+            )
+            parts.append(f'{key}={text}')
 
         return ', '.join(parts)
     except Exception:
         return _safe_repr(kwargs, maxlen=maxlen) if kwargs else ''
 
 
+def _call_suffix(*args: Any, **kwargs: Any) -> str:
+    call = _format_call(*args, **kwargs)
+    return f' ({call})' if call else ''
+
+
+class _Lazy:
+    """Аргумент лога, который форматируется только при выводе записи.
+
+    logging вызывает str() у аргументов, лишь когда запись дошла до
+    обработчика; если её отбросил фильтр, форматирования не будет.
+    Готовая строка запоминается для следующих обработчиков.
+    """
+
+    __slots__ = ('func', 'args', 'kwargs', 'text')
+
+    def __init__(self, func: Callable[..., str], *args: Any, **kwargs: Any):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self.text is None:
+            self.text = self.func(*self.args, **self.kwargs)
+        return self.text
+
+
 def logged(
     *,
     name: Optional[str] = None,
@@ -253,48 +360,90 @@ def logged(
     def decorator(func: F) -> F:
         log = logger or logging.getLogger(func.__module__)
         event = name or f'{func.__module__}.{func.__qualname__}'
+        # Сигнатура не меняется между вызовами: строим её один раз.
+        sig = _signature(func) if log_args else None
+        # Всё, что wrapper берёт на каждом вызове, — локальные замыкания,
+        # без поиска атрибутов и глобальных имён.
+        log_at = log.log
+        is_enabled_for = log.isEnabledFor
+        log_exception = log.exception
+        # Целые наносекунды; в миллисекунды — только для записи в лог.
+        perf_counter = time.perf_counter_ns
+        call_suffix = _call_suffix
+        safe_repr = _safe_repr
+        lazy = _Lazy
+
+        if not log_args and not log_result:
+            # Только время выполнения: без форматирования и без проверок
+            # флагов на каждом вызове.
+            @wraps(func)
+            def timing_wrapper(*args: Any, **kwargs: Any):
+                enabled = is_enabled_for(level)
+                if enabled:
+                    log_at(level, '%s -> start', event)
+                start = perf_counter()
+                try:
+                    result = func(*args, **kwargs)
+                except Exception:
+                    ms = (perf_counter() - start) / 1e6
+                    log_exception('%s -> error (%.1fms)', event, ms)
+                    raise
+                if enabled:
+                    ms = (perf_counter() - start) / 1e6
+                    log_at(level, '%s -> ok (%.1fms)', event, ms)
+                return result
+
+            return timing_wrapper
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any):
-            start = time.perf_counter()
-
-            if log_args:
-                call = _format_call(
-                    func,
-                    args,
-                    dict(kwargs),
-                    maxlen=maxlen,
-                    include_defaults=include_defaults,
-                    skip_none=skip_none,
-                    skip_empty=skip_empty,
-                )
-                log.log(
+            # Уровень выключен — start/ok всё равно отфильтруются, и
+            # аргументы с результатом не форматируются. Ошибка пишется
+            # как обычно: у log.exception свой уровень.
+            enabled = is_enabled_for(level)
+            start = perf_counter()
+
+            if enabled and log_args:
+                # kwargs и так свежий dict этого вызова — без копии.
+                log_at(
                     level,
                     '%s -> start%s',
                     event,
-                    f' ({call})' if call else '',
+                    lazy(
+                        call_suffix,
+                        sig,
+                        args,
+                        kwargs,
+                        maxlen=maxlen,
+                        include_defaults=include_defaults,
+                        skip_none=skip_none,
+                        skip_empty=skip_empty,
+                    ),
                 )
-            else:
-                log.log(level, '%s -> start', event)
+            elif enabled:
+                log_at(level, '%s -> start', event)
 
             try:
                 result = func(*args, **kwargs)
             except Exception:
-                ms = (time.perf_counter() - start) * 1000
-                log.exception('%s -> error (%.1fms)', event, ms)
+                ms = (perf_counter() - start) / 1e6
+                log_exception('%s -> error (%.1fms)', event, ms)
                 raise
 
-            ms = (time.perf_counter() - start) * 1000
+            if not enabled:
+                return result
+
+            ms = (perf_counter() - start) / 1e6
             if log_result:
-                log.log(
+                log_at(
                     level,
                     '%s -> ok (%.1fms) result=%s',
                     event,
                     ms,
-                    _safe_repr(result, maxlen=maxlen),
+                    lazy(safe_repr, result, maxlen=maxlen),
                 )
             else:
-                log.log(level, '%s -> ok (%.1fms)', event, ms)
+                log_at(level, '%s -> ok (%.1fms)', event, ms)
 
             return result
 
@@ -5,6 +5,8 @@ from sqlalchemy.orm import relationship
 
 from app.core.db import Base
 
+_TO_DICT_FIELDS = ('id', 'name', 'description')
+
 
 class Category(Base):
     name = Column(
@@ -28,8 +30,9 @@ class Category(Base):
         return self.name
 
     def to_dict(self) -> dict:
+        id_, name, description = self._values(_TO_DICT_FIELDS)
         return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
+            'id': id_,
+            'name': name,
+            'description': description,
         }
@@ -12,6 +12,11 @@ from sqlalchemy.orm import relationship
 
 from app.core.db import Base
 
+_PRODUCT_FIELDS = (
+    'id', 'name', 'category_id', 'unit_id', 'category', 'unit',
+)
+_UNIT_FIELDS = ('id', 'unit', 'measure_type')
+
 
 class Product(Base):
     name = Column(
@@ -49,14 +54,21 @@ class Product(Base):
         return f'{self.name}'
 
     def to_dict(self) -> dict:
+        id_, name, category_id, unit_id, category, unit = self._values(
+            _PRODUCT_FIELDS
+        )
+        if unit is not None:
+            measure_type, unit_name = unit.measure_type, unit.unit
+        else:
+            measure_type = unit_name = None
         return {
-            'id': self.id,
-            'name': self.name,
-            'category_id': self.category_id,
-            'category': getattr(self.category, 'name', None),
-            'unit_id': self.unit_id,
-            'measure_type': getattr(self.unit, 'measure_type', None),
-            'unit': getattr(self.unit, 'unit', None),
+            'id': id_,
+            'name': name,
+            'category_id': category_id,
+            'category': category.name if category is not None else None,
+            'unit_id': unit_id,
+            'measure_type': measure_type,
+            'unit': unit_name,
         }
 
 
@@ -82,8 +94,9 @@ class Unit(Base):
         return f'{self.measure_type} ({self.unit})'
 
     def to_dict(self) -> dict:
+        id_, unit, measure_type = self._values(_UNIT_FIELDS)
         return {
-            'id': self.id,
-            'unit': self.unit,
-            'measure_type': self.measure_type,
+            'id': id_,
+            'unit': unit,
+            'measure_type': measure_type,
         }
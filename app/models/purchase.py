@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from datetime import date
 from decimal import Decimal
 
@@ -19,6 +20,31 @@ from sqlalchemy.orm import relationship, validates
 
 from app.core.db import Base
 
+# Шаг округления цен и ноль: собираются один раз, а не на каждый вызов.
+_CENT = Decimal('0.01')
+_ZERO = Decimal('0')
+
+_TO_DICT_FIELDS = (
+    'id',
+    'purchase_date',
+    'product_id',
+    'store_id',
+    'quantity',
+    'total_price',
+    'regular_unit_price',
+    'is_promo',
+    'promo_type',
+    'comment',
+    'product',
+    'store',
+)
+
+
+def _unit_price(total_price, quantity) -> Decimal:
+    if not quantity:
+        return _ZERO
+    return (Decimal(total_price) / Decimal(quantity)).quantize(_CENT)
+
 
 class Purchase(Base):
     product_id = Column(
@@ -87,27 +113,47 @@ class Purchase(Base):
         Returns:
             Decimal: Цена за единицу.
         """
-        if not self.quantity:
-            return Decimal('0')
-        return (
-            Decimal(self.total_price) / Decimal(self.quantity)
-        ).quantize(Decimal('0.01'))
+        return self._unit_price_for(self.total_price, self.quantity)
+
+    def _unit_price_for(self, total_price, quantity) -> Decimal:
+        """Цена за единицу для данных суммы и количества, с памятью.
+
+        Результат запоминается на экземпляре вместе с исходными
+        значениями и отдаётся повторно, пока это те же объекты. Так
+        кеш не устаревает ни при присваивании, ни при refresh из БД,
+        который валидаторы не видят.
+        """
+        memo = self.__dict__.get('_unit_price_memo')
+        if (
+            memo is not None
+            and memo[0] is total_price
+            and memo[1] is quantity
+        ):
+            return memo[2]
+        price = _unit_price(total_price, quantity)
+        self.__dict__['_unit_price_memo'] = (total_price, quantity, price)
+        return price
 
     @property
     def effective_regular_unit_price(self) -> Decimal:
         if self.regular_unit_price is not None:
-            return (
-                Decimal(str(self.regular_unit_price)).quantize(
-                    Decimal('0.01')
-                )
-            )
+            return Decimal(str(self.regular_unit_price)).quantize(_CENT)
         return self.unit_price
 
     @validates('quantity', 'total_price')
     def _validate_non_negative(self, key, value):
         if value is None:
             return value
-        if Decimal(value) < 0:
+        # Числа сравниваются как есть; в Decimal переводятся только
+        # прочие значения (например, строки).
+        number = (
+            value if isinstance(value, (Decimal, int, float))
+            else Decimal(value)
+        )
+        # NaN проходит сравнение с нулём, поэтому отсекается отдельно.
+        if not math.isfinite(number):
+            raise ValueError(f'{key} должно быть конечным числом')
+        if number < 0:
             raise ValueError(f'{key} не может быть отрицательным')
         return value
 
@@ -119,40 +165,64 @@ class Purchase(Base):
         return value
 
     def to_dict(self) -> dict:
-        product = self.product
-        unit = getattr(product, 'unit', None)
-        category = getattr(product, 'category', None)
+        (
+            id_,
+            purchase_date,
+            product_id,
+            store_id,
+            quantity,
+            total_price,
+            regular_unit_price,
+            is_promo,
+            promo_type,
+            comment,
+            product,
+            store,
+        ) = self._values(_TO_DICT_FIELDS)
+        # Каждая связь читается один раз; прямой доступ к атрибуту
+        # вместо getattr с умолчанием.
+        if product is not None:
+            product_name = product.name
+            category_id = product.category_id
+            category = product.category
+            unit = product.unit
+        else:
+            product_name = category_id = category = unit = None
+        if unit is not None:
+            measure_type, unit_name = unit.measure_type, unit.unit
+        else:
+            measure_type = unit_name = None
 
         return {
-            'id': self.id,
-            'purchase_date': self.purchase_date,
+            'id': id_,
+            'purchase_date': purchase_date,
 
-            'product_id': self.product_id,
-            'product': getattr(product, 'name', None),
+            'product_id': product_id,
+            'product': product_name,
 
-            'category': getattr(category, 'name', None),
-            'category_id': getattr(product, 'category_id', None),
-            'measure_type': getattr(unit, 'measure_type', None),
-            'unit': getattr(unit, 'unit', None),
+            'category': category.name if category is not None else None,
+            'category_id': category_id,
+            'measure_type': measure_type,
+            'unit': unit_name,
 
-            'store_id': self.store_id,
-            'store': getattr(self.store, 'name', None),
+            'store_id': store_id,
+            'store': store.name if store is not None else None,
 
             'quantity': float(
-                self.quantity
-            ) if self.quantity is not None else None,
+                quantity
+            ) if quantity is not None else None,
             'total_price': float(
-                self.total_price
-            ) if self.total_price is not None else None,
+                total_price
+            ) if total_price is not None else None,
             'unit_price': float(
-                self.unit_price
-            ) if self.unit_price is not None else None,
+                self._unit_price_for(total_price, quantity)
+            ),
 
-            'is_promo': self.is_promo,
-            'promo_type': self.promo_type,
+            'is_promo': is_promo,
+            'promo_type': promo_type,
             'regular_unit_price': float(
-                self.regular_unit_price
-            ) if self.regular_unit_price is not None else None,
+                regular_unit_price
+            ) if regular_unit_price is not None else None,
 
-            'comment': self.comment,
+            'comment': comment,
         }
@@ -2,23 +2,32 @@
 
 from __future__ import annotations
 
-from datetime import date
+from dataclasses import dataclass
+from datetime import date, timedelta
 from typing import Any, Literal, Optional
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import func, select
+from sqlalchemy import Float, func, select, type_coerce
 
 from app.core.db import get_session
-from app.models import Product, Purchase
-from app.service.purchases import (
-    list_purchases_filtered,
-)
+from app.crud.purchases import crud as purchase_crud
+from app.models import Category, Product, Purchase, Store
+from app.validate.validators import validate_date_range
 
 GroupBy = Literal['day', 'week', 'month', 'year']
 PriceMode = Literal['paid', 'regular']
 PromoMode = Literal['include', 'exclude', 'only']
 ContributionBy = Literal['product', 'category']
 CountBy = Literal['product', 'category', 'store']
+IndexKind = Literal['basket', 'category', 'store']
+
+# Допустимые значения режимов: проверка членства без сборки множества
+# на каждый вызов.
+_GROUP_OPTS = frozenset(('day', 'week', 'month', 'year'))
+_PRICE_OPTS = frozenset(('paid', 'regular'))
+_PROMO_OPTS = frozenset(('include', 'exclude', 'only'))
+_INDEX_KINDS = frozenset(('basket', 'category', 'store'))
 
 _GROUP_TO_PERIOD = {
     'day': 'D',
@@ -27,6 +36,62 @@ _GROUP_TO_PERIOD = {
     'year': 'Y',
 }
 
+# Длина периода группировки: следующий период начинается через неё.
+_PERIOD_STEP = {
+    'day': pd.DateOffset(days=1),
+    'week': pd.DateOffset(weeks=1),
+    'month': pd.DateOffset(months=1),
+    'year': pd.DateOffset(years=1),
+}
+
+# Режим учёта акций -> фильтр is_promo в БД.
+_PROMO_TO_DB = {'include': None, 'exclude': False, 'only': True}
+
+# Колонки, которые аналитика читает из БД: только нужные расчётам, без
+# объектов Purchase. Числа приходят сразу float, минуя Decimal.
+_FRAME_COLUMNS = (
+    Purchase.id,
+    Purchase.purchase_date,
+    Purchase.product_id,
+    Product.name.label('product'),
+    Product.category_id,
+    Category.name.label('category'),
+    Purchase.store_id,
+    Store.name.label('store'),
+    type_coerce(Purchase.quantity, Float).label('quantity'),
+    type_coerce(Purchase.total_price, Float).label('total_price'),
+    type_coerce(
+        Purchase.regular_unit_price, Float
+    ).label('regular_unit_price'),
+    Purchase.is_promo,
+)
+_FRAME_NAMES = [column.key for column in _FRAME_COLUMNS]
+# Колонки, которые бывают NULL: при сплошных NULL from_records дал бы
+# object, и dtype склеенных кадров зависел бы от того, есть ли NULL.
+_FRAME_NULLABLE_DTYPES = {
+    'category_id': 'float64',
+    'regular_unit_price': 'float64',
+}
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Запрос одного индекса Ласпейреса для `batch_inflation_indices`.
+
+    Поля повторяют аргументы basket/category/store_inflation_index;
+    `kind` выбирает, какой из них посчитать.
+    """
+
+    kind: IndexKind
+    category_id: Optional[int] = None
+    store_id: Optional[int] = None
+    product_ids: Optional[tuple[int, ...]] = None
+    from_date: Optional[date] = None
+    to_date: Optional[date] = None
+    group_by: GroupBy = 'month'
+    price_mode: PriceMode = 'paid'
+    promo_mode: PromoMode = 'include'
+
 
 def _ensure_group_by(group_by: str) -> GroupBy:
     """Провалидировать тип группировки периода.
@@ -41,7 +106,7 @@ def _ensure_group_by(group_by: str) -> GroupBy:
     Raises:
         ValueError: Если передано неизвестное значение.
     """
-    if group_by not in {'day', 'week', 'month', 'year'}:
+    if group_by not in _GROUP_OPTS:
         raise ValueError(
             'group_by должен быть одним из: day, week, month, year')
     return group_by  # type: ignore[return-value]
@@ -59,7 +124,7 @@ def _ensure_price_mode(price_mode: str) -> PriceMode:
     Raises:
         ValueError: Если режим не "paid" и не "regular".
     """
-    if price_mode not in {'paid', 'regular'}:
+    if price_mode not in _PRICE_OPTS:
         raise ValueError('price_mode должен быть paid или regular')
     return price_mode  # type: ignore[return-value]
 
@@ -77,96 +142,168 @@ def _ensure_promo_mode(promo_mode: str) -> PromoMode:
     Raises:
         ValueError: Если режим не входит в допустимый набор.
     """
-    if promo_mode not in {'include', 'exclude', 'only'}:
+    if promo_mode not in _PROMO_OPTS:
         raise ValueError('promo_mode должен быть include/exclude/only')
     return promo_mode  # type: ignore[return-value]
 
 
 def _period_start(dts: pd.Series, group_by: GroupBy) -> pd.Series:
-    """Преобразовать список покупок в pandas.DataFrame.
+    """Посчитать начало периода группировки для каждой даты.
 
-    Ожидается, что объекты поддерживают `to_dict()`. Если список пустой
-    или нет ключевой колонки `purchase_date`, возвращает пустой датафрейм.
+    Считается на массиве datetime64 без `.dt`-аксессоров и PeriodArray:
+    день, месяц и год — усечением единицы datetime64, неделя — вычитанием
+    номера дня недели (неделя начинается с понедельника).
 
     Args:
-        purchases: Список объектов Purchase (или совместимых DTO).
+        dts: Даты покупок.
+        group_by: Период группировки.
 
     Returns:
-        pd.DataFrame: Датафрейм по покупкам или пустой датафрейм.
+        pd.Series: Начала периодов (datetime64[ns]) с индексом `dts`.
     """
-    dts = pd.to_datetime(dts).dt.normalize()
-
-    if group_by == 'day':
-        return dts
+    days = pd.to_datetime(dts).to_numpy('datetime64[ns]').astype(
+        'datetime64[D]'
+    )
 
     if group_by == 'week':
-        return dts - pd.to_timedelta(dts.dt.weekday, unit='D')
+        # 1970-01-01 — четверг, поэтому день недели = (дни - 4) mod 7.
+        weekday = (days.view('int64') - 4) % 7
+        starts = days - weekday.astype('timedelta64[D]')
+    elif group_by == 'month':
+        starts = days.astype('datetime64[M]')
+    elif group_by == 'year':
+        starts = days.astype('datetime64[Y]')
+    else:
+        starts = days
 
-    if group_by == 'month':
-        return dts.dt.to_period('M').dt.to_timestamp()
+    return pd.Series(starts.astype('datetime64[ns]'), index=dts.index)
 
-    return dts.dt.to_period('Y').dt.to_timestamp()
 
+def _period_bounds(day: date, group_by: GroupBy) -> tuple[date, date]:
+    """Вернуть первый и последний день периода, в который попадает дата.
 
-def _purchases_to_df(purchases: list[Any]) -> pd.DataFrame:
-    """Преобразовать список покупок в pandas.DataFrame.
+    Args:
+        day: Дата.
+        group_by: Период группировки.
 
-    Ожидается, что объекты поддерживают `to_dict()`. Если список пустой
-    или нет ключевой колонки `purchase_date`, возвращает пустой датафрейм.
+    Returns:
+        tuple[date, date]: Начало и конец периода (включительно).
+    """
+    start = _period_start(pd.Series([day]), group_by).iloc[0]
+    end = start + _PERIOD_STEP[group_by] - pd.Timedelta(days=1)
+    return start.date(), end.date()
+
+
+def _iso_dates(values: Any) -> list[str]:
+    """Отформатировать даты в строки ISO (YYYY-MM-DD) одним проходом.
 
     Args:
-        purchases: Список объектов Purchase (или совместимых DTO).
+        values: Даты (Series, DatetimeIndex или массив datetime64).
 
     Returns:
-        pd.DataFrame: Датафрейм по покупкам или пустой датафрейм.
+        list[str]: Строки дат в том же порядке.
     """
-    if not purchases:
-        return pd.DataFrame()
+    return np.asarray(
+        values, dtype='datetime64[ns]'
+    ).astype('datetime64[D]').astype(str).tolist()
 
-    rows = [p.to_dict() for p in purchases]
-    df = pd.DataFrame(rows)
 
-    # minimal sanity
-    if 'purchase_date' not in df.columns:
-        return pd.DataFrame()
+def _unit_prices(total: np.ndarray, qty: np.ndarray) -> np.ndarray:
+    """Посчитать цены за единицу так же, как `Purchase.unit_price`.
 
-    return df
+    Модель делит Decimal и округляет до копеек банковским округлением.
+    Чтобы совпасть с ней и на «половинках» (66.93 / 2 = 33.465), деление
+    идёт в целых: копейки суммы на тысячные доли количества.
 
+    Args:
+        total: Суммы покупок.
+        qty: Количества.
+
+    Returns:
+        np.ndarray: Цены за единицу (0 при нулевом количестве).
+    """
+    cents = np.rint(total * 100).astype(np.int64) * 1000
+    milli = np.rint(qty * 1000).astype(np.int64)
+    den = np.where(milli != 0, milli, 1)
+    price, rest = np.divmod(cents, den)
+    price += (2 * rest > den) | ((2 * rest == den) & (price % 2 == 1))
+    return np.where(milli != 0, price / 100, 0.0)
 
-def _apply_promo_filter(
-    df: pd.DataFrame,
-    promo_mode: PromoMode
-) -> pd.DataFrame:
-    """Отфильтровать покупки по режиму учёта акций.
 
-    - include: вернуть всё как есть
-    - exclude: убрать строки, где is_promo=True
-    - only: оставить только строки, где is_promo=True
+def _load_purchase_frame_sql(
+    *,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    store_id: Optional[int] = None,
+    product_id: Optional[int] = None,
+    product_ids: Optional[list[int]] = None,
+    category_id: Optional[int] = None,
+    promo_mode: PromoMode,
+) -> pd.DataFrame:
+    """Выгрузить покупки под фильтрами одним SELECT в pandas.DataFrame.
 
-    Если колонки `is_promo` нет:
-    - для only возвращает пустой датафрейм,
-    - иначе возвращает df без изменений.
+    Фильтр по акциям применяется в БД, ORM-объекты и `to_dict()` не
+    участвуют. Цена за единицу считается по колонкам так же, как
+    `Purchase.unit_price`: сумма / количество с округлением до копеек.
 
     Args:
-        df: Датафрейм покупок.
+        from_date: Начальная дата периода.
+        to_date: Конечная дата периода.
+        store_id: ID магазина.
+        product_id: ID продукта.
+        product_ids: Список ID продуктов (корзина).
+        category_id: ID категории.
         promo_mode: Режим учёта акций.
 
     Returns:
-        pd.DataFrame: Отфильтрованный датафрейм.
+        pd.DataFrame: Датафрейм по покупкам или пустой датафрейм.
     """
-    if df.empty:
-        return df
+    from_date, to_date = validate_date_range(from_date, to_date)
+    with get_session() as db:
+        rows = purchase_crud.rows_filtered(
+            db,
+            _FRAME_COLUMNS,
+            date_from=from_date,
+            date_to=to_date,
+            store_id=store_id,
+            product_id=product_id,
+            product_ids=product_ids,
+            category_id=category_id,
+            is_promo=_PROMO_TO_DB[promo_mode],
+        )
+    if not rows:
+        return pd.DataFrame()
+
+    df = pd.DataFrame.from_records(
+        rows, columns=_FRAME_NAMES
+    ).astype(_FRAME_NULLABLE_DTYPES)
+    df['unit_price'] = _unit_prices(
+        df['total_price'].to_numpy(dtype=float),
+        df['quantity'].to_numpy(dtype=float),
+    )
+    return df
 
-    if 'is_promo' not in df.columns:
-        return df.iloc[0:0] if promo_mode == 'only' else df
 
-    promo = df['is_promo'].fillna(False).astype(bool)
+def _numeric_column(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Вернуть колонку как float-массив.
 
-    if promo_mode == 'include':
-        return df
-    if promo_mode == 'exclude':
-        return df[~promo]
-    return df[promo]
+    Нечисловые значения и отсутствующая колонка дают NaN.
+
+    Args:
+        df: Датафрейм покупок.
+        column: Имя колонки.
+
+    Returns:
+        np.ndarray: Значения колонки (float64).
+    """
+    if column not in df.columns:
+        return np.full(len(df), np.nan)
+    values = df[column]
+    # Колонки из SQL уже числовые (в том числе рассчитанная unit_price):
+    # повторный to_numeric для них — лишний проход.
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values, errors='coerce')
+    return values.to_numpy(dtype=float)
 
 
 def _compute_price_and_spend(
@@ -191,45 +328,34 @@ def _compute_price_and_spend(
         df: Датафрейм покупок.
         price_mode: Режим цены ("paid" или "regular").
 
+    Колонки пишутся в переданный датафрейм; возвращается отфильтрованный.
+
     Returns:
-        pd.DataFrame: Датафрейм с добавленными колонками или пустойv
+        pd.DataFrame: Датафрейм с добавленными колонками или пустой
         (если данных мало).
     """
     if df.empty:
         return df
 
-    df = df.copy()
-
     if 'quantity' not in df.columns:
         return df.iloc[0:0]
+    if price_mode == 'paid' and 'unit_price' not in df.columns:
+        return df.iloc[0:0]
 
-    df['quantity'] = pd.to_numeric(df['quantity'], errors='coerce')
-    df = df[df['quantity'].notna() & (df['quantity'] > 0)]
-
-    if price_mode == 'paid':
-        if 'unit_price' not in df.columns:
-            return df.iloc[0:0]
-        df['unit_price_used'] = pd.to_numeric(
-            df['unit_price'], errors='coerce')
-    else:
-        if 'regular_unit_price' in df.columns:
-            reg = pd.to_numeric(df['regular_unit_price'], errors='coerce')
-        else:
-            reg = pd.Series([pd.NA] * len(df), index=df.index)
-
-        if 'unit_price' in df.columns:
-            paid = pd.to_numeric(df['unit_price'], errors='coerce')
-        else:
-            paid = pd.Series([pd.NA] * len(df), index=df.index)
-
-        df['unit_price_used'] = reg.fillna(paid)
-
-    df['unit_price_used'] = pd.to_numeric(
-        df['unit_price_used'], errors='coerce')
-    df = df[df['unit_price_used'].notna() & (df['unit_price_used'] > 0)]
+    # Датафрейм свой: _prepare_df_for_index собирает его на каждый вызов.
+    # Поэтому колонки дописываются на месте, а строки отбираются один раз
+    # в конце по общей маске — без копии на входе и после каждого фильтра.
+    qty = _numeric_column(df, 'quantity')
+    price = _numeric_column(df, 'unit_price')
+    if price_mode == 'regular':
+        regular = _numeric_column(df, 'regular_unit_price')
+        price = np.where(np.isnan(regular), price, regular)
 
-    df['spend'] = df['unit_price_used'] * df['quantity']
-    return df
+    df['quantity'] = qty
+    df['unit_price_used'] = price
+    df['spend'] = price * qty
+    # NaN не проходит сравнение, так что отдельный notna не нужен.
+    return df[(qty > 0) & (price > 0)]
 
 
 def _prepare_df_for_index(
@@ -247,16 +373,11 @@ def _prepare_df_for_index(
     """Собрать и подготовить датафрейм покупок для расчёта индексов.
 
     Делает полный пайплайн:
-    1) выгружает покупки из БД через `list_purchases_filtered`;
-    2) преобразует в DataFrame;
-    3) применяет фильтр промо;
-    4) рассчитывает unit_price_used/spend;
-    5) добавляет колонку `period` (начало периода группировки);
-    6) нормализует `product_id` (для индексов он обязателен).
-
-    Оптимизация:
-    - если `promo_mode == "only"`, на уровне БД ставит `is_promo=True`
-    (меньше данных).
+    1) выгружает нужные колонки покупок из БД одним SELECT, фильтр
+       промо применяется там же (`_load_purchase_frame_sql`);
+    2) рассчитывает unit_price_used/spend;
+    3) добавляет колонку `period` (начало периода группировки);
+    4) нормализует `product_id` (для индексов он обязателен).
 
     Args:
         from_date: Начальная дата периода.
@@ -271,24 +392,21 @@ def _prepare_df_for_index(
 
     Returns:
         pd.DataFrame: Подготовленный датафрейм или пустой,
-        если данных недостаточно.
+        если данных недостаточно. Строки идут по возрастанию даты
+        покупки (ORDER BY в SQL), а значит и периода.
     """
-    is_promo_db = True if promo_mode == 'only' else None
-
-    purchases = list_purchases_filtered(
+    df = _load_purchase_frame_sql(
         from_date=from_date,
         to_date=to_date,
         store_id=store_id,
         product_id=product_id,
         product_ids=product_ids,
         category_id=category_id,
-        is_promo=is_promo_db,
+        promo_mode=promo_mode,
     )
-    df = _purchases_to_df(purchases)
     if df.empty:
         return df
 
-    df = _apply_promo_filter(df, promo_mode)
     df = _compute_price_and_spend(df, price_mode)
     if df.empty:
         return df
@@ -299,13 +417,93 @@ def _prepare_df_for_index(
     if 'product_id' not in df.columns:
         return df.iloc[0:0]
 
-    df['product_id'] = pd.to_numeric(df['product_id'], errors='coerce')
-    df = df[df['product_id'].notna()]
-    df['product_id'] = df['product_id'].astype(int)
-
+    # Из БД product_id приходит целым (колонка NOT NULL): приведение и
+    # фильтр нужны только для данных другого происхождения.
+    if not pd.api.types.is_integer_dtype(df['product_id']):
+        df['product_id'] = pd.to_numeric(df['product_id'], errors='coerce')
+        df = df[df['product_id'].notna()]
+        df['product_id'] = df['product_id'].astype(int)
+
+    # После фильтров индекс с дырами; плотный RangeIndex ставится без
+    # копирования колонок (reset_index скопировал бы весь датафрейм).
+    # quantity и spend уже непрерывные float64 из _compute_price_and_spend.
+    df.index = pd.RangeIndex(len(df))
     return df
 
 
+def _prepare_endpoint_df(
+    *,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    store_id: Optional[int] = None,
+    product_ids: Optional[list[int]] = None,
+    category_id: Optional[int] = None,
+    promo_mode: PromoMode,
+    price_mode: PriceMode,
+    group_by: GroupBy,
+) -> pd.DataFrame:
+    """Подготовить датафрейм только первого и последнего периодов.
+
+    Вкладу в инфляцию нужны лишь базовый (первый) и целевой (последний)
+    периоды. Их границы берутся из MIN/MAX даты покупки в БД, и
+    выгружаются покупки только этих двух периодов, а не всего диапазона.
+
+    Если в крайнем периоде не осталось пригодных строк (цена или
+    количество не больше нуля), крайний период данных другой — тогда
+    выгружается весь диапазон, как в `_prepare_df_for_index`.
+
+    Args:
+        from_date: Начальная дата периода.
+        to_date: Конечная дата периода.
+        store_id: ID магазина.
+        product_ids: Список ID продуктов (корзина).
+        category_id: ID категории.
+        promo_mode: Режим учёта акций.
+        price_mode: Режим цены.
+        group_by: Группировка по периоду.
+
+    Returns:
+        pd.DataFrame: Подготовленный датафрейм или пустой.
+    """
+    filters = {
+        'store_id': store_id,
+        'product_ids': product_ids,
+        'category_id': category_id,
+        'promo_mode': promo_mode,
+        'price_mode': price_mode,
+        'group_by': group_by,
+    }
+    from_date, to_date = validate_date_range(from_date, to_date)
+    with get_session() as db:
+        first, last = purchase_crud.date_bounds_filtered(
+            db,
+            date_from=from_date,
+            date_to=to_date,
+            store_id=store_id,
+            product_ids=product_ids,
+            category_id=category_id,
+            is_promo=_PROMO_TO_DB[promo_mode],
+        )
+    if first is None:
+        return pd.DataFrame()
+
+    base_end = _period_bounds(first, group_by)[1]
+    target_start = _period_bounds(last, group_by)[0]
+    if target_start <= base_end + timedelta(days=1):
+        # Периоды совпадают или соседние: пропускать нечего.
+        return _prepare_df_for_index(
+            from_date=first, to_date=last, **filters)
+
+    base = _prepare_df_for_index(
+        from_date=first, to_date=base_end, **filters)
+    target = _prepare_df_for_index(
+        from_date=target_start, to_date=last, **filters)
+    if base.empty or target.empty:
+        return _prepare_df_for_index(
+            from_date=from_date, to_date=to_date, **filters)
+    return pd.concat([base, target], ignore_index=True)
+
+
 def _laspeyres_index(
     df: pd.DataFrame,
     *,
@@ -331,8 +529,11 @@ def _laspeyres_index(
                     "coverage": 0.9,
                     "items": 12}, ...
               ],
-              "kpi": {...}
+              "kpi": {...},
+              "sorted": True
             }
+            Флаг `sorted` гарантирует, что точки идут по возрастанию
+            периода и не содержат пропусков.
     """
     if df.empty:
         return {
@@ -349,16 +550,20 @@ def _laspeyres_index(
             },
         }
 
-    df = df.copy()
-    df['period'] = pd.to_datetime(df['period'])
-    df = df.sort_values('period')
+    # Периоды и товары кодируются один раз; дальше все суммы — bincount
+    # по целым кодам вместо нескольких groupby и merge.
+    period_codes, periods = pd.factorize(df['period'], sort=True)
+    product_codes, products = pd.factorize(df['product_id'])
+    n_periods, n_products = len(periods), len(products)
+    qty = df['quantity'].to_numpy(dtype=float)
+    spend = df['spend'].to_numpy(dtype=float)
 
     base_p = pd.to_datetime(
-        base_period) if base_period is not None else df['period'].min()
+        base_period) if base_period is not None else periods[0]
 
     # base weights: spend in base period per product (p0*q0)
-    base_slice = df[df['period'] == base_p]
-    if base_slice.empty:
+    base_code = periods.get_indexer([base_p])[0]
+    if base_code < 0:
         return {
             'points': [],
             'kpi': {
@@ -373,17 +578,20 @@ def _laspeyres_index(
             },
         }
 
-    base_agg = (
-        base_slice.groupby('product_id', as_index=False)
-        .agg(base_qty=('quantity', 'sum'), base_spend=('spend', 'sum'))
-        .copy()
+    in_base_rows = period_codes == base_code
+    base_qty = np.bincount(
+        product_codes[in_base_rows],
+        weights=qty[in_base_rows],
+        minlength=n_products,
     )
-    base_agg = base_agg[(base_agg['base_qty'] > 0) &
-                        (base_agg['base_spend'] > 0)]
-    base_agg['base_price'] = base_agg['base_spend'] / base_agg['base_qty']
-    base_agg['base_weight'] = base_agg['base_spend']  # p0*q0
+    base_weight = np.bincount(
+        product_codes[in_base_rows],
+        weights=spend[in_base_rows],
+        minlength=n_products,
+    )
+    in_base = (base_qty > 0) & (base_weight > 0)
 
-    if base_agg.empty:
+    if not in_base.any():
         return {
             'points': [],
             'kpi': {
@@ -398,63 +606,62 @@ def _laspeyres_index(
             },
         }
 
-    total_base_weight = float(base_agg['base_weight'].sum())
-
-    per_agg = (
-        df.groupby(['period', 'product_id'], as_index=False)
-        .agg(qty=('quantity', 'sum'), spend=('spend', 'sum'))
-        .copy()
-    )
-    per_agg = per_agg[(per_agg['qty'] > 0) & (per_agg['spend'] > 0)]
-    per_agg['price'] = per_agg['spend'] / per_agg['qty']
-
-    merged = per_agg.merge(
-        base_agg[[
-            'product_id',
-            'base_price',
-            'base_weight'
-        ]], on='product_id', how='inner')
-    merged = merged[(merged['base_price'] > 0) & (merged['price'] > 0)]
-    merged['ratio'] = merged['price'] / merged['base_price']
-    merged['w_ratio'] = merged['base_weight'] * merged['ratio']
-
-    idx = (
-        merged.groupby('period', as_index=False)
-        .agg(
-            sum_w_ratio=('w_ratio', 'sum'),
-            sum_w=('base_weight', 'sum'),
-            items=('product_id', 'nunique')
-        )
-        .copy()
+    base_price = np.divide(
+        base_weight, base_qty, out=np.zeros(n_products), where=in_base)
+    total_base_weight = float(base_weight[in_base].sum())
+
+    # Суммы по парам (период, товар); ключи отсортированы по периоду.
+    keys, key_codes = np.unique(
+        period_codes * n_products + product_codes, return_inverse=True)
+    key_qty = np.bincount(key_codes, weights=qty)
+    key_spend = np.bincount(key_codes, weights=spend)
+    key_period, key_product = np.divmod(keys, n_products)
+
+    matched = (key_qty > 0) & (key_spend > 0) & in_base[key_product]
+    key_period = key_period[matched]
+    key_product = key_product[matched]
+    ratio = (
+        key_spend[matched] / key_qty[matched] / base_price[key_product]
     )
-    idx['index'] = 100.0 * idx['sum_w_ratio'] / idx['sum_w']
-    idx['coverage'] = idx['sum_w'] / total_base_weight
+    w = base_weight[key_product]
+
+    items = np.bincount(key_period, minlength=n_periods)
+    sum_w_ratio = np.bincount(
+        key_period, weights=w * ratio, minlength=n_periods)
+    sum_w = np.bincount(key_period, weights=w, minlength=n_periods)
 
-    idx = idx.sort_values('period')
+    # Периоды без товаров базы в индекс не попадают; порядок периодов
+    # возрастающий, это же гарантируется потребителям флагом 'sorted'.
+    has_items = items > 0
+    out_periods = periods[has_items]
+    items = items[has_items]
+    index = 100.0 * sum_w_ratio[has_items] / sum_w[has_items]
+    coverage = sum_w[has_items] / total_base_weight
 
     points = [
         {
-            'period': str(pd.Timestamp(row['period']).date()),
-            'index': float(row['index']),
-            'coverage': float(row['coverage']),
-            'items': int(row['items']),
+            'period': period,
+            'index': float(period_index),
+            'coverage': float(period_coverage),
+            'items': int(period_items),
         }
-        for _, row in idx.iterrows()
+        for period, period_index, period_coverage, period_items in zip(
+            _iso_dates(out_periods), index, coverage, items,
+        )
     ]
 
-    last = idx.iloc[-1]
     kpi = {
-        'base_period': str(pd.Timestamp(base_p).date()),
-        'last_period': str(pd.Timestamp(last['period']).date()),
-        'periods': int(idx.shape[0]),
-        'items_in_base': int(base_agg.shape[0]),
+        'base_period': str(base_p.date()),
+        'last_period': str(out_periods[-1].date()),
+        'periods': int(len(out_periods)),
+        'items_in_base': int(in_base.sum()),
         'items_total_base_weight': float(total_base_weight),
-        'coverage_last': float(last['coverage']),
-        'index_last': float(last['index']),
-        'inflation_total': float(last['index'] - 100.0),
+        'coverage_last': float(coverage[-1]),
+        'index_last': float(index[-1]),
+        'inflation_total': float(index[-1] - 100.0),
     }
 
-    return {'points': points, 'kpi': kpi}
+    return {'points': points, 'kpi': kpi, 'sorted': True}
 
 
 def purchase_counts(*, by: CountBy) -> dict[int, int]:
@@ -487,8 +694,8 @@ def purchase_counts(*, by: CountBy) -> dict[int, int]:
                 .group_by(Product.category_id)
             )
 
-        rows = db.execute(stmt).all()
-        return {int(k): int(v) for k, v in rows if k is not None}
+        # NULL-ключи отсечены в WHERE, COUNT драйвер отдаёт как int.
+        return dict(db.execute(stmt).all())
 
 
 def product_inflation_index(
@@ -514,8 +721,9 @@ def product_inflation_index(
         promo_mode: Режим учёта акций.
 
     Returns:
-        dict[str, Any]: {"points": [...], "kpi": {...}} или пустые структуры
-        при отсутствии данных.
+        dict[str, Any]: {"points": [...], "kpi": {...}, "sorted": True} или
+        пустые структуры при отсутствии данных. Точки идут по возрастанию
+        периода.
     """
     group_by = _ensure_group_by(group_by)
     price_mode = _ensure_price_mode(price_mode)
@@ -537,14 +745,15 @@ def product_inflation_index(
     if df.empty:
         return {'points': [], 'kpi': None}
 
+    # Периоды уже идут по возрастанию (порядок из SQL): группировка без
+    # сортировки ключей сохраняет его.
     agg = (
-        df.groupby('period', as_index=False)
+        df.groupby('period', as_index=False, sort=False)
         .agg(
             spend=('spend', 'sum'),
             qty=('quantity', 'sum'),
             n=('id', 'count') if 'id' in df.columns else ('quantity', 'count'),
         )
-        .copy()
     )
 
     agg = agg[(agg['qty'] > 0) & (agg['spend'] > 0)]
@@ -552,7 +761,6 @@ def product_inflation_index(
         return {'points': [], 'kpi': None}
 
     agg['avg_unit_price'] = agg['spend'] / agg['qty']
-    agg = agg.sort_values('period')
 
     base_price = float(agg['avg_unit_price'].iloc[0])
     if base_price <= 0:
@@ -571,28 +779,35 @@ def product_inflation_index(
 
     kpi = {
         'product_id': int(product_id),
-        'base_period': pd.to_datetime(
-            agg['period'].iloc[0]
-        ).date().isoformat(),
+        'base_period': agg['period'].iloc[0].date().isoformat(),
         'base_price': base_price,
-        'last_period': pd.to_datetime(last['period']).date().isoformat(),
+        'last_period': last['period'].date().isoformat(),
         'last_avg_unit_price': float(last['avg_unit_price']),
         'last_index_100': float(last['index_100']),
         'change_vs_prev_period_pct': mom_pct,
         'last_n': int(last['n']),
     }
 
-    points = agg[[
-        'period',
-        'avg_unit_price',
-        'index_100',
-        'inflation_pct_from_base',
-        'n'
-    ]].to_dict('records')
-    for p in points:
-        p['period'] = pd.to_datetime(p['period']).date().isoformat()
+    points = [
+        {
+            'period': period,
+            'avg_unit_price': avg_unit_price,
+            'index_100': index_100,
+            'inflation_pct_from_base': inflation_pct,
+            'n': n,
+        }
+        for period, (avg_unit_price, index_100, inflation_pct, n) in zip(
+            _iso_dates(agg['period']),
+            agg[[
+                'avg_unit_price',
+                'index_100',
+                'inflation_pct_from_base',
+                'n'
+            ]].itertuples(index=False, name=None),
+        )
+    ]
 
-    return {'points': points, 'kpi': kpi}
+    return {'points': points, 'kpi': kpi, 'sorted': True}
 
 
 def basket_inflation_index(
@@ -711,6 +926,82 @@ def store_inflation_index(
     return _laspeyres_index(df)
 
 
+def _slice_for_spec(df: pd.DataFrame, spec: IndexSpec) -> pd.DataFrame:
+    """Отобрать из общего датафрейма строки одного запроса индекса.
+
+    Повторяет фильтры, которые отдельная функция индекса ставит в SQL.
+
+    Args:
+        df: Датафрейм `_prepare_df_for_index` без фильтров по сущностям.
+        spec: Запрос индекса.
+
+    Returns:
+        pd.DataFrame: Строки, относящиеся к запросу.
+    """
+    if spec.kind == 'category':
+        df = df[df['category_id'] == spec.category_id]
+    elif spec.kind == 'store':
+        df = df[df['store_id'] == spec.store_id]
+    if spec.kind != 'category' and spec.product_ids:
+        df = df[df['product_id'].isin(spec.product_ids)]
+    return df
+
+
+def batch_inflation_indices(
+    specs: list[IndexSpec],
+) -> dict[IndexSpec, dict[str, Any]]:
+    """Посчитать несколько индексов Ласпейреса за один проход по данным.
+
+    Запросы с одинаковыми датами и режимами (group_by, price_mode,
+    promo_mode) делят одну выгрузку и подготовку покупок; каждый индекс
+    затем считается по своему срезу в памяти. Результаты те же, что у
+    basket/category/store_inflation_index с теми же аргументами.
+
+    Args:
+        specs: Запросы индексов.
+
+    Returns:
+        dict[IndexSpec, dict[str, Any]]: Точки индекса и KPI по каждому
+        запросу.
+
+    Raises:
+        ValueError: Если режимы или вид индекса заданы неверно.
+    """
+    buckets: dict[tuple, list[IndexSpec]] = {}
+    for spec in specs:
+        if spec.kind not in _INDEX_KINDS:
+            raise ValueError('kind должен быть basket, category или store')
+        if spec.kind == 'category' and spec.category_id is None:
+            raise ValueError('Для индекса категории нужен category_id')
+        if spec.kind == 'store' and spec.store_id is None:
+            raise ValueError('Для индекса магазина нужен store_id')
+        key = (
+            spec.from_date,
+            spec.to_date,
+            _ensure_group_by(spec.group_by),
+            _ensure_price_mode(spec.price_mode),
+            _ensure_promo_mode(spec.promo_mode),
+        )
+        buckets.setdefault(key, []).append(spec)
+
+    results: dict[IndexSpec, dict[str, Any]] = {}
+    for (
+        from_date, to_date, group_by, price_mode, promo_mode
+    ), bucket in buckets.items():
+        df = _prepare_df_for_index(
+            from_date=from_date,
+            to_date=to_date,
+            promo_mode=promo_mode,
+            price_mode=price_mode,
+            group_by=group_by,
+        )
+        for spec in bucket:
+            if spec not in results:
+                results[spec] = _laspeyres_index(
+                    df if df.empty else _slice_for_spec(df, spec))
+    return results
+
+
 def product_store_price_stats(
     *,
     product_id: int,
@@ -770,7 +1061,6 @@ def product_store_price_stats(
             max_price=('unit_price_used', 'max'),
             last_date=('purchase_date', 'max'),
         )
-        .copy()
     )
     g = g[(g['qty'] > 0) & (g['spend'] > 0)]
     g['avg_unit_price'] = g['spend'] / g['qty']
@@ -778,18 +1068,28 @@ def product_store_price_stats(
 
     points = [
         {
-            'store_id': int(r['store_id']),
-            'store': r['store'],
-            'avg_unit_price': float(r['avg_unit_price']),
-            'min_unit_price': float(r['min_price']),
-            'max_unit_price': float(r['max_price']),
-            'qty': float(r['qty']),
-            'purchases': int(r['purchases']),
-            'last_date': str(
-                pd.to_datetime(r['last_date']).date()
-            ) if pd.notna(r['last_date']) else None,
+            'store_id': int(store_id),
+            'store': store,
+            'avg_unit_price': float(avg_price),
+            'min_unit_price': float(min_price),
+            'max_unit_price': float(max_price),
+            'qty': float(qty),
+            'purchases': int(n),
+            'last_date': str(last_date) if pd.notna(last_date) else None,
         }
-        for _, r in g.iterrows()
+        for (
+            store_id, store, avg_price, min_price, max_price, qty, n,
+            last_date,
+        ) in zip(
+            g['store_id'].to_numpy(),
+            g['store'].to_numpy(),
+            g['avg_unit_price'].to_numpy(),
+            g['min_price'].to_numpy(),
+            g['max_price'].to_numpy(),
+            g['qty'].to_numpy(),
+            g['purchases'].to_numpy(),
+            g['last_date'].to_numpy(),
+        )
     ]
 
     kpi = {
@@ -845,7 +1145,7 @@ def inflation_contributions(
     price_mode = _ensure_price_mode(price_mode)
     promo_mode = _ensure_promo_mode(promo_mode)
 
-    df = _prepare_df_for_index(
+    df = _prepare_endpoint_df(
         from_date=from_date,
         to_date=to_date,
         store_id=store_id,
@@ -865,16 +1165,15 @@ def inflation_contributions(
             }
         }
 
-    df['period'] = pd.to_datetime(df['period'])
-    df = df.sort_values('period')
-    base_p = df['period'].min()
-    target_p = df['period'].max()
+    # Строки упорядочены по дате в SQL, так что первый и последний
+    # периоды — крайние строки, без сортировки и min/max.
+    base_p = df['period'].iloc[0]
+    target_p = df['period'].iloc[-1]
 
     base_slice = df[df['period'] == base_p]
     base_agg = (
         base_slice.groupby('product_id', as_index=False)
         .agg(base_qty=('quantity', 'sum'), base_spend=('spend', 'sum'))
-        .copy()
     )
     base_agg = base_agg[(base_agg['base_qty'] > 0) &
                         (base_agg['base_spend'] > 0)]
@@ -896,18 +1195,20 @@ def inflation_contributions(
     t_agg = (
         t_slice.groupby('product_id', as_index=False)
         .agg(qty=('quantity', 'sum'), spend=('spend', 'sum'))
-        .copy()
     )
     t_agg = t_agg[(t_agg['qty'] > 0) & (t_agg['spend'] > 0)]
     t_agg['price'] = t_agg['spend'] / t_agg['qty']
 
-    merged = t_agg.merge(
-        base_agg[[
-            'product_id',
-            'base_price',
-            'base_weight'
-        ]], on='product_id', how='inner')
-    merged = merged[(merged['base_price'] > 0) & (merged['price'] > 0)]
+    # База — по строке на товар: цену и вес проще подставить через
+    # map по product_id, чем строить индексы join'а. Товары без базы
+    # получают NaN и отсекаются сравнением.
+    base_by_product = base_agg.set_index('product_id')
+    merged = t_agg.assign(
+        base_price=t_agg['product_id'].map(base_by_product['base_price']),
+        base_weight=t_agg['product_id'].map(base_by_product['base_weight']),
+    )
+    mask = (merged['base_price'] > 0) & (merged['price'] > 0)
+    merged = merged.loc[mask].copy()
     if merged.empty:
         return {
             'points': [],
@@ -918,34 +1219,41 @@ def inflation_contributions(
             },
         }
 
-    merged['ratio'] = merged['price'] / merged['base_price']
-
     sum_w = float(merged['base_weight'].sum())
-    merged['share_w'] = merged['base_weight'] / sum_w
     # вклад в пунктах индекса (Index-100) = share_w * (ratio-1) * 100
-    merged['contribution'] = merged['share_w'] *\
-        (merged['ratio'] - 1.0) * 100.0
+    merged = merged.assign(
+        ratio=lambda d: d['price'] / d['base_price'],
+        share_w=lambda d: d['base_weight'] / sum_w,
+        contribution=lambda d: d['share_w'] * (d['ratio'] - 1.0) * 100.0,
+    )
 
     # enrich names
     names = df[['product_id', 'product']].dropna().drop_duplicates(
         'product_id') if 'product' in df.columns else None
     if names is not None and not names.empty:
-        merged = merged.merge(names, on='product_id', how='left')
+        merged = merged.assign(product=merged['product_id'].map(
+            names.set_index('product_id')['product']))
     else:
-        merged['product'] = merged['product_id'].astype(str)
+        merged = merged.assign(product=merged['product_id'].astype(str))
 
     if by == 'product':
         out = merged.sort_values(
             'contribution', ascending=False).head(max(1, int(top)))
         points = [
             {
-                'product_id': int(r['product_id']),
-                'product': r.get('product', None),
-                'ratio': float(r['ratio']),
-                'contribution': float(r['contribution']),
-                'share_w': float(r['share_w']),
+                'product_id': int(product_id),
+                'product': product,
+                'ratio': float(ratio),
+                'contribution': float(contribution),
+                'share_w': float(share_w),
             }
-            for _, r in out.iterrows()
+            for product_id, product, ratio, contribution, share_w in zip(
+                out['product_id'].to_numpy(),
+                out['product'].to_numpy(),
+                out['ratio'].to_numpy(),
+                out['contribution'].to_numpy(),
+                out['share_w'].to_numpy(),
+            )
         ]
         kpi = {
             'by': 'product',
@@ -962,7 +1270,6 @@ def inflation_contributions(
             df[['product_id', 'category_id', 'category']]
             .dropna(subset=['category_id'])
             .drop_duplicates('product_id')
-            .copy()
         )
         cat_map['category_id'] = pd.to_numeric(
             cat_map['category_id'], errors='coerce')
@@ -972,31 +1279,42 @@ def inflation_contributions(
         cat_map = pd.DataFrame(
             columns=['product_id', 'category_id', 'category'])
 
-    merged2 = merged.merge(cat_map, on='product_id', how='left')
-    merged2['category_id'] = merged2['category_id'].fillna(-1).astype(int)
-    merged2['category'] = merged2['category'].fillna('UNKNOWN')
+    cat_map = cat_map.set_index('product_id')
+    merged = merged.assign(
+        category_id=merged['product_id'].map(
+            cat_map['category_id']).fillna(-1).astype(int),
+        category=merged['product_id'].map(
+            cat_map['category']).fillna('UNKNOWN'),
+    )
 
+    # merged — по строке на товар, поэтому число товаров в категории —
+    # просто размер группы, без подсчёта уникальных.
     cat = (
-        merged2.groupby(['category_id', 'category'], as_index=False)
+        merged.groupby(['category_id', 'category'], as_index=False)
         .agg(
             contribution=('contribution', 'sum'),
             share_w=('share_w', 'sum'),
-            items=('product_id', 'nunique'),
+            items=('product_id', 'size'),
         )
-        .copy()
     )
     cat = cat.sort_values(
         'contribution', ascending=False).head(max(1, int(top)))
 
     points = [
         {
-            'category_id': int(r['category_id']),
-            'category': r['category'],
-            'contribution': float(r['contribution']),
-            'share_w': float(r['share_w']),
-            'items': int(r['items']),
+            'category_id': int(category_id),
+            'category': category,
+            'contribution': float(contribution),
+            'share_w': float(share_w),
+            'items': int(items),
         }
-        for _, r in cat.iterrows()
+        for category_id, category, contribution, share_w, items in zip(
+            cat['category_id'].to_numpy(),
+            cat['category'].to_numpy(),
+            cat['contribution'].to_numpy(),
+            cat['share_w'].to_numpy(),
+            cat['items'].to_numpy(),
+        )
     ]
     kpi = {
         'by': 'category',
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable, Iterable, Optional, TypeVar
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
@@ -45,14 +45,19 @@ def _column_unique(model: type, field: str) -> bool:
 def get_item(
     crud,
     item_id: int,
+    *,
+    with_relations: bool = False,
 ) -> Optional[ModelT]:
     """Получить объект по ID через CRUD-слой.
 
-    Открывает сессию БД и вызывает `crud.get_or_raise(...)`.
+    Открывает сессию БД и вызывает `crud.get_or_raise(...)`
+    (или `crud.get_with_relations_or_raise(...)`).
 
     Args:
         crud: CRUD-объект для конкретной сущности.
         item_id: ID объекта.
+        with_relations: Подгрузить связи, чтобы читать их после
+            закрытия сессии.
 
     Returns:
         Optional[ModelT]: Найденный объект.
@@ -60,14 +65,32 @@ def get_item(
     Raises:
         ValueError: Если объект не найден (прокидывается из CRUD).
     """
+    getter = (
+        crud.get_with_relations_or_raise if with_relations
+        else crud.get_or_raise
+    )
     with get_session() as session:
-        item = crud.get_or_raise(
+        item = getter(
             db=session,
             obj_id=item_id,
         )
         return item
 
 
+@logged(level=logging.DEBUG)
+def has_items(crud) -> bool:
+    """Проверить, что в таблице сущности есть хотя бы одна запись.
+
+    Args:
+        crud: CRUD-объект для конкретной сущности.
+
+    Returns:
+        bool: True, если записи есть.
+    """
+    with get_session() as session:
+        return crud.exists(db=session)
+
+
 @logged(level=logging.DEBUG)
 def list_items(
     crud,
@@ -96,6 +119,65 @@ def list_items(
         return items
 
 
+@logged(level=logging.DEBUG)
+def list_page(
+    crud,
+    after_id: Optional[int] = None,
+    limit: int = 100,
+) -> list[ModelT]:
+    """Получить следующую страницу объектов по курсору.
+
+    Args:
+        crud: CRUD-объект для конкретной сущности.
+        after_id: ID последнего объекта предыдущей страницы
+            (None — первая страница).
+        limit: Размер страницы.
+
+    Returns:
+        list[ModelT]: Объекты с id > after_id, упорядоченные по id.
+    """
+    with get_session() as session:
+        return crud.fetch_page(
+            db=session,
+            after_id=after_id,
+            limit=limit,
+        )
+
+
+def iter_items(
+    crud,
+    *,
+    chunk: int = 100,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+) -> Iterator[list[ModelT]]:
+    """Отдавать объекты порциями по курсору, по мере чтения из БД.
+
+    Каждая порция читается отдельным `list_page`, так что потребитель
+    может показывать первые строки, пока следующие ещё не прочитаны.
+
+    Args:
+        crud: CRUD-объект для конкретной сущности.
+        chunk: Размер порции.
+        limit: Максимальное число объектов всего (None — без ограничения).
+        after_id: Начать после объекта с этим ID.
+
+    Yields:
+        list[ModelT]: Очередная непустая порция объектов по возрастанию id.
+    """
+    loaded = 0
+    while limit is None or loaded < limit:
+        size = chunk if limit is None else min(chunk, limit - loaded)
+        items = list_page(crud, after_id=after_id, limit=size)
+        if not items:
+            return
+        yield items
+        loaded += len(items)
+        if len(items) < size:
+            return
+        after_id = int(items[-1].id)
+
+
 @logged(level=logging.INFO, skip_empty=True)
 def create_item(
     crud,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Optional
 
 from app.core.db import get_session
 from app.crud import product_crud
@@ -31,3 +32,19 @@ def get_product(product_id: int) -> Product:
         return product_crud.get_with_relations_or_raise(
             db=session, obj_id=product_id
         )
+
+
+@logged(level=logging.DEBUG)
+def list_products_with_unit(
+    limit: int = 100,
+) -> list[tuple[int, str, Optional[str], Optional[str]]]:
+    """Получить продукты с единицами измерения (для списков в UI).
+
+    Args:
+        limit: Максимальное число продуктов.
+
+    Returns:
+        list[tuple]: (id, name, measure_type, unit) по возрастанию id.
+    """
+    with get_session() as session:
+        return product_crud.list_with_units(db=session, limit=limit)
@@ -324,6 +324,9 @@ def list_purchases_filtered(
     product_ids: Optional[list[int]] = None,
     category_id: Optional[int] = None,
     is_promo: Optional[bool] = None,
+    order_by=None,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> list[Purchase]:
     """Универсальная выборка покупок для аналитики и UI-фильтров.
 
@@ -342,6 +345,9 @@ def list_purchases_filtered(
         product_ids: Список ID продуктов (корзина/выборка).
         category_id: ID категории.
         is_promo: Фильтр по акциям (True/False) или None — без фильтра.
+        order_by: Сортировка (по умолчанию — по дате покупки).
+        offset: Смещение выборки.
+        limit: Максимальное количество записей (None — все).
 
     Returns:
         list[Purchase]: Список покупок, подходящих под фильтры.
@@ -357,8 +363,53 @@ def list_purchases_filtered(
             product_ids=product_ids,
             category_id=category_id,
             is_promo=is_promo,
+            order_by=order_by,
+            offset=offset,
+            limit=limit,
+        )
+
+
+@logged(level=logging.DEBUG, skip_empty=True)
+def count_purchases_filtered(
+    *,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    store_id: Optional[int] = None,
+    product_id: Optional[int] = None,
+    product_ids: Optional[list[int]] = None,
+    category_id: Optional[int] = None,
+    is_promo: Optional[bool] = None,
+) -> int:
+    """Посчитать покупки под фильтрами `list_purchases_filtered`.
+
+    Считает в БД (COUNT), объекты покупок не загружаются.
+
+    Args:
+        from_date: Начальная дата периода.
+        to_date: Конечная дата периода.
+        store_id: ID магазина.
+        product_id: ID продукта.
+        product_ids: Список ID продуктов (корзина/выборка).
+        category_id: ID категории.
+        is_promo: Фильтр по акциям (True/False) или None — без фильтра.
+
+    Returns:
+        int: Число подходящих покупок.
+    """
+    from_date, to_date = validate_date_range(from_date, to_date)
+    with get_session() as db:
+        return purchase_crud.count_filtered(
+            db=db,
+            date_from=from_date,
+            date_to=to_date,
+            store_id=store_id,
+            product_id=product_id,
+            product_ids=product_ids,
+            category_id=category_id,
+            is_promo=is_promo,
         )
 
+
 def get_purchase_date_bounds() -> tuple[Optional[date], Optional[date]]:
     """Возвращает минимальную и максимальную дату покупок.
 
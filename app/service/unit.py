@@ -0,0 +1,20 @@
+"""Сервисные операции для единиц измерения."""
+
+from __future__ import annotations
+
+import logging
+
+from app.core.db import get_session
+from app.crud import unit_crud
+from app.logging import logged
+
+
+@logged(level=logging.DEBUG)
+def list_measure_types() -> list[str]:
+    """Получить различные типы единиц измерения (для фильтров в UI).
+
+    Returns:
+        list[str]: Отсортированные типы без повторов.
+    """
+    with get_session() as session:
+        return unit_crud.distinct_measure_types(db=session)
@@ -57,7 +57,10 @@ def override_get_session(monkeypatch, engine):
 
     for mod_path in [
         'app.service.purchases',
+        'app.service.analytics',
         'app.service.crud_service',
+        'app.service.unit',
+        'app.service.product',
     ]:
         try:
             mod = __import__(mod_path, fromlist=['get_session'])
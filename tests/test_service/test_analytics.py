@@ -0,0 +1,168 @@
+"""Тесты сервиса аналитики."""
+
+import warnings
+from datetime import date
+
+import pytest
+from app.service import analytics, purchases
+
+
+def test_product_index_promo_modes(
+    few_purchase_in_few_stores, product_vegetable
+):
+    only = analytics.product_inflation_index(
+        product_id=product_vegetable.id,
+        group_by='day',
+        promo_mode='only',
+    )
+    assert [p['period'] for p in only['points']] == ['2024-03-06']
+    assert only['points'][0]['avg_unit_price'] == pytest.approx(90.0)
+
+    exclude = analytics.product_inflation_index(
+        product_id=product_vegetable.id,
+        group_by='day',
+        promo_mode='exclude',
+    )
+    assert [p['period'] for p in exclude['points']] == [
+        '2024-03-05',
+        '2024-03-07',
+    ]
+
+
+def test_product_index_regular_price(
+    few_purchase_in_few_stores, product_vegetable
+):
+    result = analytics.product_inflation_index(
+        product_id=product_vegetable.id,
+        group_by='month',
+        price_mode='regular',
+    )
+    # 2 * 75 + 1 * 105 (обычная цена вместо акционной) + 3 * 80
+    assert result['kpi']['base_price'] == pytest.approx(495.0 / 6.0)
+
+
+def test_unit_price_matches_model_rounding(product_vegetable, few_stores):
+    # 66.93 / 2 = 33.465: модель округляет банковским округлением
+    purchase = purchases.create_purchase(
+        store_id=few_stores[0].id,
+        product_id=product_vegetable.id,
+        quantity=2.0,
+        price=66.93,
+        purchase_date=date(2024, 1, 9),
+    )
+    stats = analytics.product_store_price_stats(
+        product_id=product_vegetable.id,
+    )
+    assert stats['points'][0]['min_unit_price'] == float(
+        purchase.unit_price
+    )
+
+
+def test_contributions_compare_first_and_last_period(
+    few_purchase_in_single_store, product_vegetable, single_store
+):
+    purchases.create_purchase(
+        store_id=single_store.id,
+        product_id=product_vegetable.id,
+        quantity=1.0,
+        price=100.0,
+        purchase_date=date(2024, 4, 1),
+    )
+    result = analytics.inflation_contributions(group_by='month')
+
+    assert result['kpi']['base_period'] == '2024-01-01'
+    assert result['kpi']['target_period'] == '2024-04-01'
+    # 100 в апреле против 80 в январе; февраль в расчёт не входит
+    assert result['points'][0]['ratio'] == pytest.approx(1.25)
+    assert result['points'][0]['contribution'] == pytest.approx(25.0)
+
+
+def test_contributions_skip_products_without_base_price(
+    product_vegetable, product_no_category, single_store
+):
+    for product, price, day in [
+        (product_vegetable, 80.0, date(2024, 1, 10)),
+        (product_vegetable, 100.0, date(2024, 4, 1)),
+        (product_no_category, 50.0, date(2024, 4, 2)),
+    ]:
+        purchases.create_purchase(
+            store_id=single_store.id,
+            product_id=product.id,
+            quantity=1.0,
+            price=price,
+            purchase_date=day,
+        )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        by_product = analytics.inflation_contributions(group_by='month')
+        by_category = analytics.inflation_contributions(
+            group_by='month', by='category'
+        )
+
+    # товара без покупок в базовом периоде нет в базе: фильтр по
+    # base_price > 0 отсекает его строку
+    assert [p['product_id'] for p in by_product['points']] == [
+        product_vegetable.id
+    ]
+    assert by_category['points'][0]['items'] == 1
+
+
+def test_contributions_concat_periods_with_null_columns(
+    product_vegetable, product_no_category, single_store
+):
+    # В базовом периоде только товар без категории: category_id там
+    # сплошь NULL, а в целевом периоде заполнен
+    for product, price, day in [
+        (product_no_category, 40.0, date(2024, 1, 10)),
+        (product_vegetable, 80.0, date(2024, 2, 10)),
+        (product_no_category, 50.0, date(2024, 4, 1)),
+        (product_vegetable, 100.0, date(2024, 4, 2)),
+    ]:
+        purchases.create_purchase(
+            store_id=single_store.id,
+            product_id=product.id,
+            quantity=1.0,
+            price=price,
+            purchase_date=day,
+        )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = analytics.inflation_contributions(
+            group_by='month', by='category'
+        )
+
+    assert result['points'][0]['category_id'] == -1
+    assert result['points'][0]['contribution'] == pytest.approx(25.0)
+
+
+def test_batch_indices_match_single_calls(
+    few_purchase_in_few_stores, product_vegetable, few_stores
+):
+    store_spec = analytics.IndexSpec('store', store_id=few_stores[0].id)
+    category_spec = analytics.IndexSpec(
+        'category', category_id=product_vegetable.category_id
+    )
+    basket_spec = analytics.IndexSpec(
+        'basket', product_ids=(product_vegetable.id,), group_by='day'
+    )
+
+    result = analytics.batch_inflation_indices(
+        [store_spec, category_spec, basket_spec]
+    )
+
+    assert result[store_spec] == analytics.store_inflation_index(
+        store_id=few_stores[0].id
+    )
+    assert result[category_spec] == analytics.category_inflation_index(
+        category_id=product_vegetable.category_id
+    )
+    assert result[basket_spec] == analytics.basket_inflation_index(
+        product_ids=[product_vegetable.id], group_by='day'
+    )
+
+
+def test_batch_indices_require_entity_id():
+    with pytest.raises(ValueError):
+        analytics.batch_inflation_indices([analytics.IndexSpec('store')])
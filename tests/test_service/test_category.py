@@ -1,5 +1,6 @@
 """Тесты сервиса категорий."""
 
+from app.crud import get_version
 from app.crud.categories import crud
 from app.service import crud_service
 
@@ -46,3 +47,29 @@ def test_get_list_category(few_categories):
     category_ids = [category.id for category in category_list]
     for cat in few_categories:
         assert cat.id in category_ids
+
+
+def test_list_category_pages(few_categories):
+    first = crud_service.list_page(crud, limit=2)
+    rest = crud_service.list_page(crud, after_id=first[-1].id, limit=2)
+    assert [c.id for c in first + rest] == sorted(
+        c.id for c in few_categories
+    )
+    assert len(rest) == 1
+
+
+def test_iter_category_chunks(few_categories):
+    chunks = list(crud_service.iter_items(crud, chunk=2))
+    assert [len(c) for c in chunks] == [2, 1]
+
+    limited = list(crud_service.iter_items(crud, chunk=2, limit=3))
+    assert sum(len(c) for c in limited) == 3
+
+
+def test_category_mutation_bumps_version(category_food):
+    before = get_version('category')
+    crud_service.update_item(crud, category_food.id, name='Фрукты')
+    assert get_version('category') == before + 1
+
+    crud_service.delete_item(crud, category_food.id)
+    assert get_version('category') == before + 2
@@ -2,6 +2,7 @@
 
 from app.crud.products import crud
 from app.service import crud_service
+from app.service.product import list_products_with_unit
 
 
 def test_create_product(product_vegetable, category_food, unit_kg):
@@ -59,3 +60,18 @@ def test_get_list_product(few_products):
     assert 'Помидоры' in product_names
     assert 'Морковь' in product_names
     assert 'Капуста' in product_names
+
+
+def test_list_product_relations_loaded(few_products):
+    # Сессия уже закрыта: связи должны прийти вместе со списком,
+    # иначе обращение к ним упадёт с DetachedInstanceError.
+    for product in crud_service.list_page(crud):
+        assert product.category.name == 'Овощи'
+        assert product.unit.unit == 'кг'
+
+
+def test_list_products_with_unit(few_products, product_no_category):
+    rows = list_products_with_unit()
+    assert rows[0][1:] == ('Помидоры', 'вес', 'кг')
+    assert rows[-1][1:] == ('Вода минеральная', 'объем', 'л')
+    assert [r[0] for r in rows] == sorted(r[0] for r in rows)
@@ -4,6 +4,7 @@ from datetime import date, timedelta
 from decimal import ROUND_HALF_UP, Decimal
 
 import pytest
+from app.models import Purchase
 from app.service import purchases
 
 
@@ -175,6 +176,13 @@ def test_create_purchase_with_zero_price_raises_error(
     assert 'Стоимость' in str(exc_info.value)
 
 
+def test_purchase_rejects_nan_and_infinity():
+    for field in ('quantity', 'total_price'):
+        for value in (float('nan'), float('inf'), Decimal('NaN')):
+            with pytest.raises(ValueError):
+                Purchase(**{field: value})
+
+
 def test_update_purchase_set_promo_fields_turns_promo_on(purchase_product):
     updated = purchases.update_purchase(
         purchase_id=purchase_product.id,
@@ -217,3 +225,38 @@ def test_list_purchases_filter_by_promo(
     assert len(all_items) == len(promo_items) + len(non_promo_items)
     assert all(p.is_promo for p in promo_items)
     assert all(not p.is_promo for p in non_promo_items)
+
+
+def test_list_purchases_filtered_order_and_limit(
+    few_purchase_in_few_stores,
+    few_stores,
+):
+    items = purchases.list_purchases_filtered(
+        from_date=date(2024, 3, 6),
+        order_by=Purchase.purchase_date.desc(),
+        limit=5,
+    )
+    assert [p.purchase_date for p in items] == [
+        date(2024, 3, 7),
+        date(2024, 3, 6),
+    ]
+
+    items = purchases.list_purchases_filtered(
+        store_id=few_stores[0].id,
+        to_date=date(2024, 3, 31),
+        limit=1,
+    )
+    assert [p.store_id for p in items] == [few_stores[0].id]
+
+
+def test_list_purchases_filtered_pages(few_purchase_in_few_stores):
+    assert purchases.count_purchases_filtered() == 3
+    assert purchases.count_purchases_filtered(
+        from_date=date(2024, 3, 6)
+    ) == 2
+
+    first = purchases.list_purchases_filtered(limit=2)
+    rest = purchases.list_purchases_filtered(offset=2, limit=2)
+    assert [p.id for p in first + rest] == [
+        p.id for p in few_purchase_in_few_stores
+    ]
@@ -0,0 +1,28 @@
+"""Тесты табличной модели GUI."""
+
+from decimal import Decimal
+
+from app.gui.table_model import DictTableModel
+
+
+def test_sort_by_mixed_type_column():
+    model = DictTableModel(
+        [('id', 'ID'), ('price', 'Цена')],
+        [
+            {'id': 1, 'price': '—'},
+            {'id': 2, 'price': Decimal('10.50')},
+            {'id': 3, 'price': None},
+            {'id': 4, 'price': 3},
+            {'id': 5, 'price': 7.25},
+        ],
+    )
+
+    model.sort_by('price')
+    assert [model.row_dict(i)['id'] for i in range(model.rowCount())] == [
+        4, 5, 2, 1, 3,
+    ]
+
+    model.sort_by('price', ascending=False)
+    assert [model.row_dict(i)['id'] for i in range(model.rowCount())] == [
+        1, 2, 5, 4, 3,
+    ]
@@ -0,0 +1,17 @@
+"""Тесты сервиса единиц измерения."""
+
+from app.crud.units import crud
+from app.service.crud_service import has_items
+from app.service.unit import list_measure_types
+
+
+def test_list_measure_types(unit_kg, unit_l):
+    assert list_measure_types() == ['вес', 'объем']
+
+
+def test_has_units(unit_kg):
+    assert has_items(crud)
+
+
+def test_has_no_units():
+    assert not has_items(crud)